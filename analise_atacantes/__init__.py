@@ -0,0 +1 @@
+"""Pipeline de análise de atacantes das 5 principais ligas europeias (Understat)."""
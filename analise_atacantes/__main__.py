@@ -0,0 +1,4 @@
+from analise_atacantes.pipeline import main
+
+if __name__ == "__main__":
+    main()
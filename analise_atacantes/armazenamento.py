@@ -0,0 +1,123 @@
+from functools import lru_cache
+
+import pandas as pd
+
+TABELA = "estatisticas_understat"
+CHAVE = ['Id', 'Liga', 'Time', 'Temporada']
+
+# SQL Server aceita no máximo 2100 parâmetros por comando
+MAX_PARAMETROS = 2000
+# Linhas por bloco nas leituras em streaming
+CHUNK_LEITURA = 50_000
+
+
+@lru_cache(maxsize=None)
+def criar_engine(url: str, pool_size: int = 5, max_overflow: int = 5, pool_recycle: int = 1800):
+    """Engine com pool de conexões configurado, compartilhado por URL dentro do processo.
+
+    Conexões são testadas antes do uso (pre_ping) e recicladas após `pool_recycle` s;
+    no SQL Server via pyodbc os INSERTs usam `fast_executemany`.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import make_url
+
+    kwargs = {}
+    if make_url(url).get_backend_name() != "sqlite":
+        kwargs.update(pool_size=pool_size, max_overflow=max_overflow, pool_recycle=pool_recycle)
+    if make_url(url).get_driver_name() == "pyodbc":
+        kwargs['fast_executemany'] = True
+    return create_engine(url, pool_pre_ping=True, **kwargs)
+
+
+def garantir_indice(conn, tabela: str = TABELA):
+    """Índice (Liga, Temporada, Id): atende a consulta de partições, as leituras e o DELETE do upsert."""
+    from sqlalchemy import Index, MetaData, Table
+
+    tabela_sql = Table(tabela, MetaData(), autoload_with=conn)
+    Index(f"ix_{tabela}_particao", tabela_sql.c.Liga, tabela_sql.c.Temporada, tabela_sql.c.Id).create(
+        conn, checkfirst=True)
+
+
+def particoes_existentes(engine, tabela: str = TABELA, temporadas=None):
+    """Pares (liga, temporada) presentes em `tabela`, numa única consulta (opcionalmente só de `temporadas`)."""
+    from sqlalchemy import bindparam, inspect, text
+
+    if not inspect(engine).has_table(tabela):
+        return set()
+    sql = f"SELECT DISTINCT Liga, Temporada FROM {tabela}"
+    params = {}
+    if temporadas is not None:
+        sql += " WHERE Temporada IN :temporadas"
+        params['temporadas'] = [int(t) for t in temporadas]
+    consulta = text(sql)
+    if params:
+        consulta = consulta.bindparams(bindparam('temporadas', expanding=True))
+    with engine.connect() as conn:
+        return {(liga, int(temporada)) for liga, temporada in conn.execute(consulta, params)}
+
+
+def _metodo_insercao(conn):
+    # Com fast_executemany o executemany do pyodbc já envia o lote inteiro de uma vez;
+    # nos demais bancos um INSERT multi-linha evita uma ida ao servidor por linha
+    if getattr(conn.dialect, 'fast_executemany', False) or conn.dialect.name == "sqlite":
+        return None
+    return "multi"
+
+
+def gravar_particoes(engine, df, tabela: str = TABELA, chunksize: int = 1000):
+    """Upsert de `df` em `tabela` pela chave (Id, Liga, Time, Temporada).
+
+    Linhas já existentes com a mesma chave são removidas e o lote é reinserido em
+    inserções em bloco, tudo na mesma transação; o resto da tabela não é tocado.
+    """
+    from sqlalchemy import inspect, text
+
+    if df.empty:
+        return 0
+
+    with engine.begin() as conn:
+        metodo = _metodo_insercao(conn)
+        if metodo == "multi":
+            chunksize = max(1, min(chunksize, MAX_PARAMETROS // len(df.columns)))
+        else:
+            chunksize = max(chunksize, 10_000)
+        if inspect(conn).has_table(tabela):
+            chaves = df[CHAVE].drop_duplicates().to_dict('records')
+            conn.execute(
+                text(f"DELETE FROM {tabela} WHERE Liga = :Liga AND Temporada = :Temporada "
+                     f"AND Id = :Id AND Time = :Time"),
+                chaves
+            )
+        df.to_sql(tabela, con=conn, if_exists="append", index=False,
+                  chunksize=chunksize, method=metodo)
+        garantir_indice(conn, tabela)
+    return len(df)
+
+
+def ler_particoes(engine, pares, tabela: str = TABELA, chunksize: int = CHUNK_LEITURA):
+    """Lê os pares (liga, temporada) numa única consulta, em blocos de `chunksize` linhas.
+
+    Gerador de DataFrames: o cursor é consumido em streaming (server-side quando o driver
+    suporta), então só um bloco de linhas cruas fica em memória por vez.
+    """
+    from sqlalchemy import bindparam, text
+
+    pares = set(pares)
+    if not pares:
+        return
+    consulta = text(f"SELECT * FROM {tabela} WHERE Liga IN :ligas AND Temporada IN :temporadas").bindparams(
+        bindparam('ligas', expanding=True), bindparam('temporadas', expanding=True))
+    params = {'ligas': sorted({liga for liga, _ in pares}),
+              'temporadas': sorted({int(temporada) for _, temporada in pares})}
+
+    # IN x IN pode trazer combinações não pedidas, filtradas em cada bloco
+    filtrar = len(params['ligas']) * len(params['temporadas']) > len(pares)
+
+    with engine.connect() as conn:
+        conn = conn.execution_options(stream_results=True)
+        for bloco in pd.read_sql_query(consulta, con=conn, params=params, chunksize=chunksize):
+            if filtrar:
+                chaves = pd.MultiIndex.from_arrays([bloco['Liga'], bloco['Temporada'].astype('int64')])
+                bloco = bloco[chaves.isin(list(pares))]
+            if not bloco.empty:
+                yield bloco
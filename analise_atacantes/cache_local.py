@@ -0,0 +1,69 @@
+import json
+import os
+import time
+
+import pyarrow.feather as feather
+
+DIRETORIO_CACHE = "cache_understat"
+TTL_PADRAO = 24 * 3600
+
+
+class CacheParticoes:
+    """Snapshots Feather (Arrow IPC, sem compressão) por (liga, temporada) com manifesto JSON.
+
+    Os arquivos são lidos via memory-map; o manifesto guarda quando cada partição foi
+    obtida e de onde veio, e `ttl` (segundos, None = nunca expira) define se ainda vale.
+    """
+
+    def __init__(self, diretorio: str = DIRETORIO_CACHE, ttl: float = TTL_PADRAO):
+        self.diretorio = diretorio
+        self.ttl = ttl
+        self.caminho_manifesto = os.path.join(diretorio, "manifesto.json")
+        self.manifesto = self._ler_manifesto()
+
+    def _ler_manifesto(self):
+        try:
+            with open(self.caminho_manifesto, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _salvar_manifesto(self):
+        tmp = self.caminho_manifesto + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.manifesto, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self.caminho_manifesto)
+
+    @staticmethod
+    def _chave(liga: str, temporada: int):
+        return f"{liga}|{temporada}"
+
+    def contem(self, liga: str, temporada: int):
+        entrada = self.manifesto.get(self._chave(liga, temporada))
+        return entrada is not None and os.path.exists(os.path.join(self.diretorio, entrada['arquivo']))
+
+    def fresco(self, liga: str, temporada: int):
+        if not self.contem(liga, temporada):
+            return False
+        if self.ttl is None:
+            return True
+        return time.time() - self.manifesto[self._chave(liga, temporada)]['buscado_em'] < self.ttl
+
+    def ler(self, liga: str, temporada: int):
+        entrada = self.manifesto[self._chave(liga, temporada)]
+        caminho = os.path.join(self.diretorio, entrada['arquivo'])
+        return feather.read_table(caminho, memory_map=True).to_pandas()
+
+    def gravar(self, liga: str, temporada: int, df, origem: str):
+        os.makedirs(self.diretorio, exist_ok=True)
+        arquivo = f"{liga}_{temporada}.feather"
+        tmp = os.path.join(self.diretorio, arquivo + ".tmp")
+        feather.write_feather(df.reset_index(drop=True), tmp, compression="uncompressed")
+        os.replace(tmp, os.path.join(self.diretorio, arquivo))
+        self.manifesto[self._chave(liga, temporada)] = {
+            'arquivo': arquivo,
+            'buscado_em': time.time(),
+            'linhas': len(df),
+            'origem': origem,
+        }
+        self._salvar_manifesto()
@@ -0,0 +1,114 @@
+import argparse
+
+import pandas as pd
+
+from analise_atacantes.armazenamento import (TABELA, criar_engine, gravar_particoes, ler_particoes,
+                                             particoes_existentes)
+from analise_atacantes.cache_local import CacheParticoes
+from analise_atacantes.coleta import LIGAS, coletar
+from analise_atacantes.perfil import medir
+
+
+def carregar_particoes(engine, pares, tabela: str = TABELA, atualizar=(), **kwargs_coleta):
+    """Baixa os pares (liga, temporada) ausentes em `tabela`, mais os de `atualizar` mesmo
+    se já presentes, e os grava via upsert.
+
+    Retorna {(liga, temporada): DataFrame} com as partições recém-baixadas.
+    """
+    existentes = particoes_existentes(engine, tabela, {temporada for _, temporada in pares})
+    faltantes = [par for par in pares if par not in existentes or par in atualizar]
+    if not faltantes:
+        print("Todas as partições já estão no banco")
+        return {}
+
+    print(f"Coletando {len(faltantes)} partições ausentes ou vencidas...")
+    partes = coletar(faltantes, **kwargs_coleta)
+    if partes:
+        df = pd.concat(partes.values(), ignore_index=True)
+        with medir('sql', 'gravar', linhas=len(df)):
+            linhas = gravar_particoes(engine, df, tabela)
+        print(f"{linhas} linhas gravadas em {tabela} ({len(partes)} partições)")
+    return partes
+
+
+def carregar_temporadas(engine, ligas, temporadas, tabela: str = TABELA, **kwargs_coleta):
+    pares = [(liga, temporada) for temporada in temporadas for liga in ligas]
+    return list(carregar_particoes(engine, pares, tabela, **kwargs_coleta))
+
+
+def carregar_dados(engine, ligas, temporadas, cache=None, offline: bool = False,
+                   tabela: str = TABELA, **kwargs_coleta):
+    """Monta o DataFrame das partições pedidas, priorizando o cache local.
+
+    Partições frescas no cache são lidas direto do disco; as demais vêm do banco (ou da
+    API, se ausentes no banco) e são regravadas no cache. As da temporada em andamento
+    vencidas no cache são sempre buscadas de novo na API e regravadas no banco, já que o
+    banco só teria a mesma cópia antiga. Com `offline=True` o cache é
+    usado mesmo vencido e nem banco nem API são acessados. `engine=None` dispensa o banco.
+    """
+    cache = cache if cache is not None else CacheParticoes()
+    pares = [(liga, temporada) for temporada in temporadas for liga in ligas]
+
+    partes = {}
+    pendentes = []
+    for par in pares:
+        if cache.fresco(*par) or (offline and cache.contem(*par)):
+            with medir('cache', f"ler {par[0]} {par[1]}") as registro:
+                partes[par] = cache.ler(*par)
+                registro['linhas'] = len(partes[par])
+        else:
+            pendentes.append(par)
+
+    if pendentes and offline:
+        raise FileNotFoundError(f"Partições ausentes do cache local (modo offline): {pendentes}")
+
+    if pendentes:
+        if engine is None:
+            baixadas = coletar(pendentes, **kwargs_coleta)
+        else:
+            from analise_atacantes.cliente_understat import temporada_atual
+
+            vencidas = [par for par in pendentes if par[1] == temporada_atual() and cache.contem(*par)]
+            baixadas = carregar_particoes(engine, pendentes, tabela, atualizar=vencidas, **kwargs_coleta)
+        novas = {par: (df_par, "api") for par, df_par in baixadas.items() if par in pendentes}
+
+        do_banco = [par for par in pendentes if par not in baixadas]
+        if engine is not None and do_banco:
+            blocos = {}
+            with medir('sql', f"ler {len(do_banco)} partições") as registro:
+                for bloco in ler_particoes(engine, do_banco, tabela):
+                    for (liga, temporada), grupo in bloco.groupby(['Liga', 'Temporada'], sort=False):
+                        blocos.setdefault((liga, int(temporada)), []).append(grupo)
+                registro['linhas'] = sum(len(g) for grupos in blocos.values() for g in grupos)
+            for par, grupos in blocos.items():
+                novas[par] = (pd.concat(grupos, ignore_index=True), "sql")
+
+        for par in pendentes:
+            if par not in novas or novas[par][0].empty:
+                continue
+            df_par, origem = novas[par]
+            cache.gravar(*par, df_par, origem)
+            partes[par] = df_par
+
+    if not partes:
+        raise RuntimeError("Nenhuma partição disponível no cache, no banco ou na API")
+    return pd.concat([partes[par] for par in pares if par in partes], ignore_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backfill de temporadas do Understat no banco")
+    parser.add_argument("--db", required=True, help="string de conexão SQLAlchemy")
+    parser.add_argument("--temporadas", nargs=2, type=int, metavar=("INICIO", "FIM"), required=True)
+    parser.add_argument("--ligas", nargs="+", default=LIGAS)
+    parser.add_argument("--tabela", default=TABELA)
+    parser.add_argument("--max-concorrencia", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    engine = criar_engine(args.db)
+    inicio, fim = args.temporadas
+    carregar_temporadas(engine, args.ligas, range(inicio, fim + 1), args.tabela,
+                        max_concorrencia=args.max_concorrencia)
+
+
+if __name__ == "__main__":
+    main()
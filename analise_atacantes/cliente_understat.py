@@ -0,0 +1,182 @@
+import asyncio
+import datetime
+import hashlib
+import json
+import os
+import time
+from email.utils import parsedate_to_datetime
+
+import aiohttp
+
+from analise_atacantes.cache_local import DIRETORIO_CACHE
+from analise_atacantes.perfil import registrar
+
+URL_UNDERSTAT = "https://understat.com"
+DIRETORIO_RESPOSTAS = os.path.join(DIRETORIO_CACHE, "respostas")
+# Validade das respostas da temporada em andamento (as encerradas nunca expiram)
+TTL_TEMPORADA_ATUAL = 6 * 3600
+REQUISICOES_POR_S = 2.0
+RAJADA = 5
+
+# Nome da liga na URL do Understat, quando difere do usado aqui
+NOMES_URL = {'epl': 'EPL', 'La_Liga': 'La_liga'}
+
+
+def temporada_atual(hoje=None):
+    """Temporada em andamento no padrão do Understat (ano de início; a virada é em julho)."""
+    hoje = hoje or datetime.date.today()
+    return hoje.year if hoje.month >= 7 else hoje.year - 1
+
+
+def segundos_retry_after(valor, padrao: float):
+    """Espera pedida pelo cabeçalho Retry-After: segundos ou data HTTP (RFC 9110); `padrao` se ausente/inválido."""
+    if valor is None:
+        return padrao
+    try:
+        return max(0.0, float(valor))
+    except ValueError:
+        pass
+    try:
+        data = parsedate_to_datetime(valor)
+    except (TypeError, ValueError):
+        return padrao
+    if data.tzinfo is None:
+        data = data.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (data - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+class BaldeTokens:
+    """Limitador token bucket: `taxa` requisições/s em média, rajadas de até `capacidade`.
+
+    `pausar` esvazia o balde e bloqueia novas requisições por um tempo, ex.: ao receber
+    429 com Retry-After.
+    """
+
+    def __init__(self, taxa: float = REQUISICOES_POR_S, capacidade: int = RAJADA):
+        self.taxa = taxa
+        self.capacidade = capacidade
+        self.tokens = float(capacidade)
+        self.ultimo = time.monotonic()
+        self.pausado_ate = 0.0
+        self._trava = asyncio.Lock()
+
+    async def adquirir(self):
+        async with self._trava:
+            while True:
+                agora = time.monotonic()
+                if agora < self.pausado_ate:
+                    await asyncio.sleep(self.pausado_ate - agora)
+                    continue
+                self.tokens = min(self.capacidade, self.tokens + (agora - self.ultimo) * self.taxa)
+                self.ultimo = agora
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.taxa)
+
+    def pausar(self, segundos: float):
+        self.pausado_ate = max(self.pausado_ate, time.monotonic() + segundos)
+        self.tokens = 0.0
+
+
+class CacheRespostas:
+    """Respostas brutas do Understat em disco, um arquivo JSON por (endpoint, parâmetros).
+
+    Cada arquivo guarda o corpo e os metadados da resposta (quando foi buscada, ETag e
+    Last-Modified), usados para decidir a validade e para revalidar com requisição condicional.
+    """
+
+    def __init__(self, diretorio: str = DIRETORIO_RESPOSTAS):
+        self.diretorio = diretorio
+
+    def _caminho(self, endpoint: str, *partes):
+        nome = "_".join(str(p) for p in partes)
+        if not nome.replace("_", "").isalnum():
+            nome = hashlib.sha1(nome.encode()).hexdigest()
+        return os.path.join(self.diretorio, endpoint, f"{nome}.json")
+
+    def ler(self, endpoint: str, *partes):
+        try:
+            with open(self._caminho(endpoint, *partes), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def fresca(entrada, ttl):
+        return ttl is None or time.time() - entrada['buscado_em'] < ttl
+
+    def gravar(self, endpoint: str, partes, corpo: str, etag=None, ultima_modificacao=None):
+        caminho = self._caminho(endpoint, *partes)
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        entrada = {'buscado_em': time.time(), 'etag': etag, 'last_modified': ultima_modificacao, 'corpo': corpo}
+        with open(caminho + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(entrada, f, ensure_ascii=False)
+        os.replace(caminho + ".tmp", caminho)
+        return entrada
+
+
+class ClienteUnderstat:
+    """Cliente dos endpoints JSON do Understat com cache de respostas e limite de taxa.
+
+    Compatível com o `Understat(session)` usado em `coleta` (`get_league_players` e
+    `get_player_matches`). Temporadas encerradas são servidas do cache para sempre; a
+    temporada atual e o histórico de partidas valem `ttl_atual` segundos e, vencidos, são
+    revalidados com If-None-Match/If-Modified-Since. Só as idas à rede passam pelo token
+    bucket. Erros HTTP (incluindo 429, que também pausa o balde pelo Retry-After, e um 304
+    sem resposta em cache) sobem como aiohttp.ClientResponseError para o retry de
+    `coleta.com_tentativas`.
+    `url_base` permite apontar para um servidor HTTP local em testes.
+    """
+
+    def __init__(self, session, cache=None, balde=None, ttl_atual: float = TTL_TEMPORADA_ATUAL,
+                 url_base: str = URL_UNDERSTAT):
+        self.session = session
+        self.cache = cache or CacheRespostas()
+        self.balde = balde or BaldeTokens()
+        self.ttl_atual = ttl_atual
+        self.url_base = url_base.rstrip("/")
+
+    async def _obter(self, endpoint: str, partes, url: str, ttl):
+        rotulo = f"{endpoint} {' '.join(str(p) for p in partes)}"
+        entrada = self.cache.ler(endpoint, *partes)
+        if entrada is not None and self.cache.fresca(entrada, ttl):
+            registrar('http', rotulo, origem='cache')
+            return json.loads(entrada['corpo'])
+
+        headers = {'X-Requested-With': 'XMLHttpRequest'}
+        if entrada is not None and entrada.get('etag'):
+            headers['If-None-Match'] = entrada['etag']
+        if entrada is not None and entrada.get('last_modified'):
+            headers['If-Modified-Since'] = entrada['last_modified']
+
+        await self.balde.adquirir()
+        inicio = time.perf_counter()
+        async with self.session.get(url, headers=headers) as resposta:
+            if resposta.status == 304 and entrada is not None:
+                corpo, origem = entrada['corpo'], 'revalidado'
+            else:
+                if resposta.status == 429:
+                    self.balde.pausar(segundos_retry_after(resposta.headers.get('Retry-After'), 1 / self.balde.taxa))
+                if resposta.status == 304:
+                    raise aiohttp.ClientResponseError(resposta.request_info, resposta.history, status=304,
+                                                      message="Not Modified sem resposta em cache",
+                                                      headers=resposta.headers)
+                resposta.raise_for_status()
+                corpo, origem = await resposta.text(), 'rede'
+            etag, ultima_modificacao = resposta.headers.get('ETag'), resposta.headers.get('Last-Modified')
+
+        dados = json.loads(corpo)
+        self.cache.gravar(endpoint, partes, corpo, etag or (entrada or {}).get('etag'),
+                          ultima_modificacao or (entrada or {}).get('last_modified'))
+        registrar('http', rotulo, origem=origem, parede_s=time.perf_counter() - inicio, bytes=len(corpo))
+        return dados
+
+    async def get_league_players(self, league: str, season: int):
+        ttl = None if int(season) < temporada_atual() else self.ttl_atual
+        url = f"{self.url_base}/getLeagueData/{NOMES_URL.get(league, league)}/{season}"
+        return (await self._obter('liga', (league, season), url, ttl))['players']
+
+    async def get_player_matches(self, player_id):
+        url = f"{self.url_base}/getPlayerData/{player_id}"
+        return (await self._obter('jogador', (player_id,), url, self.ttl_atual))['matches']
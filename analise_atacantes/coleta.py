@@ -0,0 +1,131 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from analise_atacantes.metricas import parse_jogadores
+from analise_atacantes.perfil import registrar
+
+LIGAS = ["Ligue_1", "epl", "La_Liga", "Bundesliga", "Serie_A"]
+
+
+async def com_tentativas(chamada, rotulo: str, timeout: float = 30, tentativas: int = 3,
+                         backoff: float = 1.0):
+    """Aguarda `chamada()` com timeout, repetindo com backoff exponencial em erros de rede.
+
+    Retorna (resultado, número da tentativa que deu certo).
+    """
+    import aiohttp
+
+    for tentativa in range(1, tentativas + 1):
+        try:
+            return await asyncio.wait_for(chamada(), timeout), tentativa
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if tentativa == tentativas:
+                raise
+            espera = backoff * 2 ** (tentativa - 1)
+            print(f"[{rotulo}] Falha na tentativa {tentativa} ({e!r}), nova tentativa em {espera:.1f}s")
+            await asyncio.sleep(espera)
+
+
+@asynccontextmanager
+async def sessao_understat(max_concorrencia: int = 5, client_factory=None):
+    """Sessão aiohttp compartilhada (pool limitado a `max_concorrencia` conexões) e o cliente sobre ela.
+
+    Por padrão o cliente é `ClienteUnderstat` (cache de respostas em disco + token bucket);
+    `client_factory=understat.Understat` acessa o site diretamente.
+    """
+    import aiohttp
+
+    if client_factory is None:
+        from analise_atacantes.cliente_understat import ClienteUnderstat
+        client_factory = ClienteUnderstat
+
+    connector = aiohttp.TCPConnector(limit=max_concorrencia)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        yield client_factory(session)
+
+
+async def get_league_player_stats(understat, league: str, season: int, timeout: float = 30,
+                                  tentativas: int = 3, backoff: float = 1.0):
+    inicio = time.perf_counter()
+    players, tentativa = await com_tentativas(lambda: understat.get_league_players(league, season),
+                                              f"{league} {season}", timeout, tentativas, backoff)
+    print(f"[{league} {season}] Total de jogadores encontrados: {len(players)}")
+    df, rejeitados = parse_jogadores(players, league, season)
+    registrar('coleta', f"{league} {season}", parede_s=time.perf_counter() - inicio,
+              linhas=len(df), rejeitados=len(rejeitados), tentativas=tentativa)
+    if len(rejeitados) > 0:
+        print(f"[{league} {season}] {len(rejeitados)} registros rejeitados: "
+              f"{', '.join(rejeitados['player_name'].astype(str).head(5))}")
+    return df, rejeitados
+
+
+async def coletar_ligas(pares, max_concorrencia: int = 5, timeout: float = 30, tentativas: int = 3,
+                        backoff: float = 1.0, client_factory=None, rejeitados=None):
+    """Coleta todos os pares (liga, temporada) em paralelo numa única sessão HTTP.
+
+    `client_factory` recebe a sessão e devolve um objeto com `get_league_players`
+    (por padrão `ClienteUnderstat`); em testes pode ser substituído por um fake local.
+    Retorna {(liga, temporada): DataFrame}; partições que falharem após todas as
+    tentativas são reportadas e omitidas. Se `rejeitados` for um dict, recebe os
+    registros malformados de cada partição.
+    """
+    pares = list(pares)
+    semaforo = asyncio.Semaphore(max_concorrencia)
+
+    async with sessao_understat(max_concorrencia, client_factory) as understat:
+        async def coletar_par(league, season):
+            async with semaforo:
+                return await get_league_player_stats(understat, league, season, timeout, tentativas, backoff)
+
+        resultados = await asyncio.gather(*(coletar_par(league, season) for league, season in pares),
+                                          return_exceptions=True)
+
+    partes = {}
+    for par, resultado in zip(pares, resultados):
+        if isinstance(resultado, BaseException):
+            print(f"[{par[0]} {par[1]}] Coleta falhou: {resultado!r}")
+            continue
+        partes[par], rejeitados_par = resultado
+        if rejeitados is not None:
+            rejeitados[par] = rejeitados_par
+    return partes
+
+
+def coletar(pares, **kwargs):
+    return asyncio.run(coletar_ligas(pares, **kwargs))
+
+
+async def coletar_partidas_jogadores(ids, max_concorrencia: int = 5, timeout: float = 30,
+                                     tentativas: int = 3, backoff: float = 1.0, client_factory=None):
+    """Histórico de partidas (`get_player_matches`) de cada jogador, em paralelo na mesma sessão.
+
+    Retorna {id: [partida, ...]}; jogadores cuja coleta falhar são reportados e omitidos.
+    """
+    ids = list(ids)
+    semaforo = asyncio.Semaphore(max_concorrencia)
+
+    async with sessao_understat(max_concorrencia, client_factory) as understat:
+        async def coletar_jogador(id_jogador):
+            async with semaforo:
+                inicio = time.perf_counter()
+                partidas, tentativa = await com_tentativas(lambda: understat.get_player_matches(id_jogador),
+                                                           f"jogador {id_jogador}", timeout, tentativas, backoff)
+                registrar('coleta', f"partidas {id_jogador}", parede_s=time.perf_counter() - inicio,
+                          linhas=len(partidas), tentativas=tentativa)
+                return partidas
+
+        resultados = await asyncio.gather(*(coletar_jogador(id_jogador) for id_jogador in ids),
+                                          return_exceptions=True)
+
+    partidas = {}
+    for id_jogador, resultado in zip(ids, resultados):
+        if isinstance(resultado, BaseException):
+            print(f"[jogador {id_jogador}] Coleta de partidas falhou: {resultado!r}")
+            continue
+        partidas[id_jogador] = resultado
+    return partidas
+
+
+def coletar_partidas(ids, **kwargs):
+    return asyncio.run(coletar_partidas_jogadores(ids, **kwargs))
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from analise_atacantes.metricas import calcular_por_90
+
+CHAVE_JOGADOR = ['Id', 'Temporada']
+
+COLUNAS_SOMA = ['Gols', 'Assistências', 'xG', 'xA', 'Finalizações', 'Passes-chave', 'Minutos', 'Jogos']
+
+
+def consolidar_transferencias(df):
+    """Une numa única linha os registros de um jogador que atuou por mais de um time na temporada.
+
+    A chave é (Id, Temporada), para não misturar homônimos. Totais são somados, `Time`
+    lista todos os clubes e `Liga`/`Nome`/`Posição` vêm do registro com mais minutos.
+    Tudo é feito em uma passada de groupby, linear no número de linhas.
+    """
+    repetidos = df.duplicated(CHAVE_JOGADOR, keep=False)
+    if not repetidos.any():
+        return df
+
+    multi = df[repetidos]
+    grupos = multi.groupby(CHAVE_JOGADOR, sort=False)
+
+    principal = multi.loc[grupos['Minutos'].idxmax()].set_index(CHAVE_JOGADOR)
+    consolidado = grupos[COLUNAS_SOMA].sum()
+    times = multi[CHAVE_JOGADOR + ['Time']].drop_duplicates()
+    # join sobre strings comuns: iterar grupos de uma coluna categórica é bem mais lento
+    consolidado['Time'] = (times['Time'].astype(str)
+                           .groupby([times[c] for c in CHAVE_JOGADOR], sort=False).agg(', '.join))
+    for coluna in ['Nome', 'Posição', 'Liga']:
+        consolidado[coluna] = principal[coluna]
+
+    consolidado = calcular_por_90(consolidado.reset_index())
+    return pd.concat([df[~repetidos], consolidado[df.columns]], ignore_index=True)
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DIRETORIO_EXPORTACAO = "exportacao"
+ARQUIVO_INDICE = "indice.json"
+FORMATOS = ['parquet', 'csv', 'json']
+COLUNAS_PARTICAO = ['Temporada', 'Liga']
+
+
+def _hash_particao(df):
+    """Hash do conteúdo e do esquema (nomes e dtypes das colunas) da partição."""
+    esquema = ",".join(f"{c}:{df[c].dtype}" for c in df.columns)
+    conteudo = int(pd.util.hash_pandas_object(df, index=False).sum())
+    return hashlib.sha1(f"{esquema}|{conteudo}".encode()).hexdigest()
+
+
+def _chave(particoes, valores):
+    return "/".join(f"{c}={v}" for c, v in zip(particoes, valores))
+
+
+def _gravar(caminho, escrever):
+    # Prefixo "." para leitores de dataset (pyarrow, Spark) ignorarem o arquivo parcial
+    tmp = os.path.join(os.path.dirname(caminho), f".{os.path.basename(caminho)}.tmp")
+    escrever(tmp)
+    os.replace(tmp, caminho)
+
+
+class ExportadorParticionado:
+    """Tabelas em partições <formato>/<tabela>/Temporada=<t>/Liga=<l>/ (layout Hive) + índice JSON.
+
+    Cada formato tem sua própria árvore, para `parquet/<tabela>` poder ser lido como um
+    dataset (pyarrow/Spark/DuckDB); no Parquet as colunas de partição vêm do caminho, e
+    nos arquivos CSV/JSON de compatibilidade ficam todas as colunas. O índice guarda as
+    colunas de cada tabela e, por partição, o hash do conteúdo, o número de linhas e os
+    arquivos; só partições novas ou alteradas são regravadas. Partições do escopo da
+    execução que não vieram em `df` são removidas (arquivos e índice); as de fora do
+    escopo ficam intactas, exceto com `substituir=True`.
+    """
+
+    def __init__(self, diretorio: str = DIRETORIO_EXPORTACAO, formatos=FORMATOS):
+        self.diretorio = diretorio
+        self.formatos = list(formatos)
+        self.caminho_indice = os.path.join(diretorio, ARQUIVO_INDICE)
+        try:
+            with open(self.caminho_indice, encoding="utf-8") as f:
+                self.indice = json.load(f)
+        except FileNotFoundError:
+            self.indice = {'tabelas': {}}
+
+    def exportar(self, nome: str, df, particoes=COLUNAS_PARTICAO, substituir: bool = False, escopo=None):
+        """Grava `df` como a tabela `nome`; retorna (partições regravadas, partições removidas).
+
+        `escopo` são as tuplas de valores das partições (na ordem de `particoes`) que a
+        execução cobriu, ex.: os pares (temporada, liga) consultados; por padrão, todas as
+        partições das temporadas (primeira coluna) presentes em `df`. Com `substituir` a
+        tabela passa a ter só as partições de `df`, ex.: uma seleção global como a
+        shortlist, que não é um fato por temporada.
+        """
+        tabela = self.indice['tabelas'].setdefault(nome, {'colunas_particao': list(particoes), 'particoes': {}})
+        if tabela['colunas_particao'] != list(particoes):
+            for entrada in tabela['particoes'].values():
+                self._remover_arquivos(nome, entrada['arquivos'])
+            tabela.update(colunas_particao=list(particoes), particoes={})
+
+        tabela['colunas'] = [str(c) for c in df.columns]
+
+        regravadas = []
+        presentes = set()
+        for valores, grupo in df.groupby(list(particoes), observed=True, sort=True):
+            valores = valores if isinstance(valores, tuple) else (valores,)
+            chave = _chave(particoes, valores)
+            presentes.add(chave)
+            grupo = grupo.reset_index(drop=True)
+            hash_conteudo = _hash_particao(grupo)
+            entrada = tabela['particoes'].get(chave)
+            arquivos = [f"{formato}/{nome}/{chave}/dados.{formato}" for formato in self.formatos]
+            if (entrada is not None and entrada['hash'] == hash_conteudo and entrada['arquivos'] == arquivos
+                    and all(os.path.exists(os.path.join(self.diretorio, a)) for a in arquivos)):
+                continue
+
+            for formato, arquivo in zip(self.formatos, arquivos):
+                caminho = os.path.join(self.diretorio, *arquivo.split("/"))
+                os.makedirs(os.path.dirname(caminho), exist_ok=True)
+                self._gravar_formato(grupo, particoes, formato, caminho)
+            if entrada is not None:
+                # Formatos que saíram da lista desde a última gravação
+                self._remover_arquivos(nome, [a for a in entrada['arquivos'] if a not in arquivos])
+            tabela['particoes'][chave] = {'hash': hash_conteudo, 'linhas': len(grupo), 'arquivos': arquivos,
+                                          'atualizado_em': time.time()}
+            regravadas.append(chave)
+
+        if substituir:
+            removidas = [chave for chave in tabela['particoes'] if chave not in presentes]
+        elif escopo is None:
+            temporadas = {_chave(particoes[:1], [v]) for v in df[particoes[0]].unique()}
+            removidas = [chave for chave in tabela['particoes']
+                         if chave not in presentes and chave.split("/")[0] in temporadas]
+        else:
+            escopo = {_chave(particoes, valores) for valores in escopo}
+            removidas = [chave for chave in tabela['particoes'] if chave not in presentes and chave in escopo]
+        for chave in removidas:
+            self._remover_arquivos(nome, tabela['particoes'].pop(chave)['arquivos'])
+
+        if regravadas or removidas or not os.path.exists(self.caminho_indice):
+            self._salvar_indice()
+        return regravadas, removidas
+
+    def _remover_arquivos(self, nome: str, arquivos):
+        """Apaga os arquivos e as pastas de partição que ficarem vazias (até <formato>/<tabela>)."""
+        for arquivo in arquivos:
+            partes = arquivo.split("/")
+            try:
+                os.remove(os.path.join(self.diretorio, *partes))
+            except FileNotFoundError:
+                pass
+            raiz = os.path.join(self.diretorio, partes[0], nome)
+            pasta = os.path.dirname(os.path.join(self.diretorio, *partes))
+            while pasta != raiz and os.path.isdir(pasta) and not os.listdir(pasta):
+                os.rmdir(pasta)
+                pasta = os.path.dirname(pasta)
+
+    @staticmethod
+    def _gravar_formato(grupo, particoes, formato, caminho):
+        if formato == 'parquet':
+            tabela = pa.Table.from_pandas(grupo.drop(columns=list(particoes)), preserve_index=False)
+            _gravar(caminho, lambda tmp: pq.write_table(tabela, tmp, compression='zstd'))
+        elif formato == 'csv':
+            _gravar(caminho, lambda tmp: grupo.to_csv(tmp, index=False))
+        elif formato == 'json':
+            _gravar(caminho, lambda tmp: grupo.to_json(tmp, orient='records', force_ascii=False))
+        else:
+            raise ValueError(f"Formato de exportação desconhecido: {formato}")
+
+    def _salvar_indice(self):
+        os.makedirs(self.diretorio, exist_ok=True)
+        _gravar(self.caminho_indice, self._escrever_indice)
+
+    def _escrever_indice(self, caminho):
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(self.indice, f, indent=2, ensure_ascii=False)
+
+
+def exportar_resultados(tabelas, diretorio: str = DIRETORIO_EXPORTACAO, formatos=FORMATOS, substituir=(),
+                        escopo=None):
+    """Exporta {nome: DataFrame} e retorna {nome: partições regravadas}.
+
+    As tabelas em `substituir` são trocadas inteiras e as demais limpas dentro de
+    `escopo` (ver `ExportadorParticionado.exportar`).
+    """
+    exportador = ExportadorParticionado(diretorio, formatos)
+    regravadas = {}
+    for nome, df in tabelas.items():
+        regravadas[nome], removidas = exportador.exportar(nome, df, substituir=nome in substituir, escopo=escopo)
+        print(f"Exportação '{nome}': {len(regravadas[nome])} partições regravadas "
+              f"de {df.groupby(COLUNAS_PARTICAO, observed=True).ngroups}, {len(removidas)} removidas")
+    return regravadas
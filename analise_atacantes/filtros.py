@@ -0,0 +1,21 @@
+clubes_grandes = [
+    "Real Madrid", "Bayern Munich", "Manchester City", "Paris Saint Germain", "Barcelona",
+    "Liverpool", "Atletico Madrid", "Manchester United", "Chelsea", "Borussia Dortmund",
+    "Juventus", "Arsenal", "Roma", "Inter", "Sevilla", "Benfica", "Bayer Leverkusen",
+    "Tottenham", "Porto", "Napoli"
+]
+
+
+def aplicar_filtros_realistas(df, clubes_excluidos=(), min_jogos: int = 15, min_minutos: int = 900,
+                              min_gols_90: float = 0.2):
+    """Atacantes com relevância estatística; uma única máscara, uma única cópia."""
+    mascara = (
+        df['Posição'].str.contains('F', na=False) &
+        (df['Jogos'] >= min_jogos) &
+        (df['Minutos'] >= min_minutos) &
+        (df['Gols_90min'] >= min_gols_90)
+    )
+    if len(clubes_excluidos) > 0:
+        mascara &= ~df['Time'].isin(clubes_excluidos)
+
+    return df[mascara]
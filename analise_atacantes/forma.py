@@ -0,0 +1,240 @@
+import argparse
+import json
+import os
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from analise_atacantes.cache_local import DIRETORIO_CACHE
+
+DIRETORIO_FORMA = os.path.join(DIRETORIO_CACHE, 'forma')
+JANELA_PADRAO = 5
+# Peso da partida mais recente na média exponencial de minutos/90
+ALFA_PADRAO = 0.3
+
+
+def parse_partidas(partidas, temporadas=None, apos=None):
+    """Partidas de `get_player_matches` (campos em texto) → lista de (data, partida, temporada, minutos, gols, xG).
+
+    Ordenada da mais antiga para a mais recente; registros malformados são descartados.
+    Com `temporadas` só essas temporadas são lidas, e `apos` ({temporada: (data, partida)})
+    pula as partidas até a última já processada de cada temporada antes de converter o resto.
+    """
+    apos = apos or {}
+    linhas = []
+    for p in partidas:
+        try:
+            temporada = int(p['season'])
+            if temporadas is not None and temporada not in temporadas:
+                continue
+            chave = (str(p['date']), int(p['id']))
+            if temporada in apos and chave <= apos[temporada]:
+                continue
+            linhas.append((*chave, temporada, int(p['time']), int(p['goals']), float(p['xG'])))
+        except (KeyError, TypeError, ValueError):
+            continue
+    linhas.sort(key=lambda linha: (linha[0], linha[1]))
+    return linhas
+
+
+class _Janela:
+    __slots__ = ('partidas', 'minutos', 'gols', 'xg', 'regularidade', 'total', 'encerrada')
+
+    def __init__(self, n):
+        self.partidas = deque(maxlen=n)
+        self.minutos = 0
+        self.gols = 0
+        self.xg = 0.0
+        self.regularidade = None
+        self.total = 0
+        # Atualizada depois do fim da temporada: não há mais partidas a buscar
+        self.encerrada = False
+
+    def adicionar(self, partida, alfa):
+        if len(self.partidas) == self.partidas.maxlen:
+            _, _, _, minutos, gols, xg = self.partidas[0]
+            self.minutos -= minutos
+            self.gols -= gols
+            self.xg -= xg
+        self.partidas.append(partida)
+        _, _, _, minutos, gols, xg = partida
+        self.minutos += minutos
+        self.gols += gols
+        self.xg += xg
+        jogado = min(minutos / 90, 1.0)
+        self.regularidade = jogado if self.regularidade is None else alfa * jogado + (1 - alfa) * self.regularidade
+        self.total += 1
+
+    def nova(self, partida):
+        if not self.partidas:
+            return True
+        ultima = self.partidas[-1]
+        return (partida[0], partida[1]) > (ultima[0], ultima[1])
+
+
+class JanelaMovel:
+    """Métricas de forma nas últimas `n` partidas de cada jogador em cada temporada, atualizadas
+    incrementalmente.
+
+    Cada (jogador, temporada) guarda só a janela (deque) e as somas correntes dela, então a
+    janela de uma temporada nunca mistura partidas da anterior, e `atualizar`
+    custa O(partidas novas): o histórico é varrido do fim só até a última partida já
+    processada (data/id) e a que sai da janela é subtraída das somas. A regularidade recente é uma
+    média exponencial de min(minutos/90, 1) por partida, com peso `alfa` na mais nova.
+    """
+
+    def __init__(self, n: int = JANELA_PADRAO, alfa: float = ALFA_PADRAO):
+        self.n = n
+        self.alfa = alfa
+        self.janelas = {}
+
+    def janela(self, id_jogador: int, temporada: int):
+        chave = (id_jogador, temporada)
+        if chave not in self.janelas:
+            self.janelas[chave] = _Janela(self.n)
+        return self.janelas[chave]
+
+    def ultimas(self, id_jogador: int):
+        """{temporada: (data, partida)} da última partida já processada do jogador em cada temporada."""
+        return {temporada: janela.partidas[-1][:2] for (i, temporada), janela in self.janelas.items()
+                if i == id_jogador and janela.partidas}
+
+    def atualizar(self, id_jogador: int, partidas):
+        """Acrescenta as partidas ainda não vistas, cada uma na janela da sua temporada; retorna quantas entraram.
+
+        `partidas` vem de `parse_partidas` (ordem crescente): a lista de cada temporada é
+        percorrida de trás para frente até a última partida já processada, e só as
+        seguintes são aplicadas.
+        """
+        por_temporada = {}
+        for partida in partidas:
+            por_temporada.setdefault(partida[2], []).append(partida)
+        novas = 0
+        for temporada, lista in por_temporada.items():
+            janela = self.janela(id_jogador, temporada)
+            inicio = len(lista)
+            while inicio > 0 and janela.nova(lista[inicio - 1]):
+                inicio -= 1
+            for i in range(inicio, len(lista)):
+                janela.adicionar(lista[i], self.alfa)
+            novas += len(lista) - inicio
+        return novas
+
+    def metricas(self):
+        """Uma linha por (jogador, temporada) com partidas, com as métricas da janela atual."""
+        chaves = [chave for chave, janela in self.janelas.items() if janela.partidas]
+        janelas = [self.janelas[chave] for chave in chaves]
+        minutos = np.array([j.minutos for j in janelas], dtype='float64')
+        por_90 = np.divide(90, minutos, out=np.zeros_like(minutos), where=minutos > 0)
+        regularidade = np.array([j.regularidade for j in janelas], dtype='float64')
+        return pd.DataFrame({
+            'Id': np.array([i for i, _ in chaves], dtype='int64'),
+            'Temporada': np.array([t for _, t in chaves], dtype='int64'),
+            'Ultima_Partida': [j.partidas[-1][0] for j in janelas],
+            'Partidas_Janela': np.array([len(j.partidas) for j in janelas], dtype='int64'),
+            'Minutos_Janela': minutos.astype('int64'),
+            'Gols_Janela_90min': np.round(np.array([j.gols for j in janelas]) * por_90, 2),
+            'xG_Janela_90min': np.round(np.array([j.xg for j in janelas]) * por_90, 2),
+            'Fator_Regularidade_Recente': np.clip(np.sqrt(regularidade), 0.7, 1.0),
+        })
+
+    def salvar(self, diretorio: str = DIRETORIO_FORMA):
+        os.makedirs(diretorio, exist_ok=True)
+        caminho = os.path.join(diretorio, 'janelas.json')
+        estado = {
+            'n': self.n,
+            'alfa': self.alfa,
+            'jogadores': {f"{i}|{t}": {'partidas': list(j.partidas), 'regularidade': j.regularidade,
+                                       'total': j.total, 'encerrada': j.encerrada}
+                          for (i, t), j in self.janelas.items()},
+        }
+        with open(caminho + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(estado, f)
+        os.replace(caminho + ".tmp", caminho)
+
+    @classmethod
+    def carregar(cls, diretorio: str = DIRETORIO_FORMA):
+        with open(os.path.join(diretorio, 'janelas.json'), encoding="utf-8") as f:
+            estado = json.load(f)
+        motor = cls(estado['n'], estado['alfa'])
+        for chave, dados in estado['jogadores'].items():
+            if '|' not in chave:
+                raise ValueError("Estado de forma sem separação por temporada")
+            id_jogador, temporada = chave.split('|')
+            janela = motor.janela(int(id_jogador), int(temporada))
+            for partida in dados['partidas']:
+                janela.partidas.append(tuple(partida))
+            janela.minutos = sum(p[3] for p in janela.partidas)
+            janela.gols = sum(p[4] for p in janela.partidas)
+            janela.xg = sum(p[5] for p in janela.partidas)
+            janela.regularidade = dados['regularidade']
+            janela.total = dados['total']
+            janela.encerrada = dados['encerrada']
+        return motor
+
+
+def carregar_janelas(diretorio: str = DIRETORIO_FORMA, n: int = JANELA_PADRAO, alfa: float = ALFA_PADRAO):
+    """Estado persistido, ou um motor vazio se não existir ou tiver outra janela/alfa."""
+    try:
+        motor = JanelaMovel.carregar(diretorio)
+    except FileNotFoundError:
+        return JanelaMovel(n, alfa)
+    except ValueError as e:
+        print(f"Janela de forma gravada em formato antigo ({e}); recalculando do zero")
+        return JanelaMovel(n, alfa)
+    if (motor.n, motor.alfa) != (n, alfa):
+        print(f"Janela de forma gravada com n={motor.n}, alfa={motor.alfa}; recalculando do zero")
+        return JanelaMovel(n, alfa)
+    return motor
+
+
+def atualizar_forma(pares, diretorio: str = DIRETORIO_FORMA, n: int = JANELA_PADRAO, alfa: float = ALFA_PADRAO,
+                    offline: bool = False, **kwargs_coleta):
+    """Alimenta as janelas persistidas dos pares (Id, Temporada) e retorna as métricas deles.
+
+    Só são buscados os jogadores com alguma janela ainda aberta (temporada em andamento,
+    ou não atualizada desde que a temporada acabou), e de cada histórico só as partidas
+    das temporadas pedidas posteriores à última já processada são lidas. Em modo offline
+    só o estado já gravado é usado.
+    """
+    pares = {(int(i), int(t)) for i, t in pares}
+    motor = carregar_janelas(diretorio, n, alfa)
+    if not offline:
+        from analise_atacantes.cliente_understat import temporada_atual
+        from analise_atacantes.coleta import coletar_partidas
+
+        temporadas = {}
+        for id_jogador, temporada in pares:
+            chave = (id_jogador, temporada)
+            if chave not in motor.janelas or not motor.janelas[chave].encerrada:
+                temporadas.setdefault(id_jogador, set()).add(temporada)
+        partidas = coletar_partidas(list(temporadas), **kwargs_coleta) if temporadas else {}
+        novas = 0
+        atual = temporada_atual()
+        for id_jogador, historico in partidas.items():
+            novas += motor.atualizar(id_jogador, parse_partidas(historico, temporadas[id_jogador],
+                                                                motor.ultimas(id_jogador)))
+            for temporada in temporadas[id_jogador]:
+                motor.janela(id_jogador, temporada).encerrada = temporada < atual
+        print(f"Forma recente: {novas} partidas novas de {len(partidas)} jogadores "
+              f"({len(temporadas)} com janela aberta de {len({i for i, _ in pares})})")
+        motor.salvar(diretorio)
+    metricas = motor.metricas()
+    chaves = pd.MultiIndex.from_frame(metricas[['Id', 'Temporada']])
+    return metricas[chaves.isin(list(pares))].reset_index(drop=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Métricas de forma (janela móvel) dos jogadores já processados")
+    parser.add_argument("--forma", dest="diretorio", default=DIRETORIO_FORMA)
+    parser.add_argument("-n", type=int, default=10, help="quantidade de jogadores listados")
+    parser.add_argument("--ordenar", default='xG_Janela_90min')
+    args = parser.parse_args(argv)
+
+    metricas = JanelaMovel.carregar(args.diretorio).metricas()
+    print(metricas.sort_values(args.ordenar, ascending=False, kind='stable').head(args.n).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,440 @@
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import matplotlib
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+from analise_atacantes.perfil import registrar
+
+FORMATOS = ('png', 'svg', 'none')
+
+ESTILO = {'font.size': 10}
+
+liga_colors = {
+    'epl': 'red',
+    'La_Liga': 'orange',
+    'Bundesliga': 'green',
+    'Serie_A': 'blue',
+    'Ligue_1': 'purple'
+}
+
+
+def _nova_figura(**kwargs):
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def criar_dashboard_matriz_decisao(shortlist, df_fwd, caminho, dpi=300):
+    fig = _nova_figura(figsize=(16, 10))
+    ax = fig.subplots()
+
+    colors = [liga_colors.get(liga, 'gray') for liga in shortlist['Liga']]
+    sizes = shortlist['Jogos'] * 4
+
+    ax.scatter(shortlist['Score_Ponderado'], shortlist['Custo_Beneficio'],
+               c=colors, s=sizes, alpha=0.8, edgecolors='black', linewidth=1.5)
+    score_medio = shortlist['Score_Ponderado'].median()
+    cb_medio = shortlist['Custo_Beneficio'].median()
+
+    ax.axhline(y=cb_medio, color='gray', linestyle='--', alpha=0.6, linewidth=2)
+    ax.axvline(x=score_medio, color='gray', linestyle='--', alpha=0.6, linewidth=2)
+    top10 = shortlist.head(10)
+    for i, (_, jogador) in enumerate(top10.iterrows()):
+        info_text = (f"{jogador['Nome'][:30]}\n"
+                    f"{jogador['Time'][:15]}\n"
+                    f"G: {jogador['Gols_90min']:.2f}/90min\n"
+                    f"A: {jogador['Assistências_90min']:.2f}/90min")
+        offset_x = 15 if i % 2 == 0 else -80
+        offset_y = 15 + (i % 3) * 20
+
+        ax.annotate(info_text,
+                    (jogador['Score_Ponderado'], jogador['Custo_Beneficio']),
+                    xytext=(offset_x, offset_y), textcoords='offset points',
+                    fontsize=8, fontweight='bold',
+                    bbox=dict(boxstyle="round,pad=0.4",
+                             facecolor="yellow" if i < 3 else "lightblue",
+                             alpha=0.9, edgecolor='black'),
+                    arrowprops=dict(arrowstyle='->', color='black', alpha=0.7))
+    ax.text(0.75, 0.25, 'ZONA PRIORITÁRIA\n* Pontuação Alta + Alto C/B\n(Alvos Principais)',
+            transform=ax.transAxes, fontsize=11, fontweight='bold',
+            bbox=dict(boxstyle="round", facecolor="lightgreen", alpha=0.8),
+            ha='center', va='center')
+
+    ax.text(0.30, 0.75, 'OPORTUNIDADES\n* Pontuação Média + Alto C/B\n(Avaliar Potencial)',
+            transform=ax.transAxes, fontsize=11, fontweight='bold',
+            bbox=dict(boxstyle="round", facecolor="lightyellow", alpha=0.8),
+            ha='center', va='center')
+
+    ax.set_xlabel('Pontuação Ponderada (Qualidade Técnica)', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Custo-Benefício (Oportunidade de Mercado)', fontsize=14, fontweight='bold')
+    ax.set_title('MATRIZ DE DECISÃO ESTRATÉGICA\nFoco nos Top 10 Atacantes Identificados',
+                 fontsize=16, fontweight='bold', pad=20)
+    legend_elements = [Line2D([0], [0], marker='o', color='w', markerfacecolor=color,
+                             markersize=10, label=liga.replace('_', ' '))
+                      for liga, color in liga_colors.items()]
+    ax.legend(handles=legend_elements, title="Liga de Origem",
+              loc='upper left', fontsize=10, title_fontsize=11)
+
+    ax.grid(True, alpha=0.4, linestyle=':')
+    fig.tight_layout()
+    fig.savefig(caminho, dpi=dpi, bbox_inches='tight')
+
+def criar_perfil_individual_top5(shortlist, df_fwd, caminho, dpi=300):
+    fig = _nova_figura(figsize=(20, 8))
+    axes = fig.subplots(1, 5)
+
+    top5 = shortlist.head(5)
+
+    for idx, (i, jogador) in enumerate(top5.iterrows()):
+        ax = axes[idx]
+        metricas = ['Gols/90', 'Assist/90', 'Eficiência', 'Regularidade']
+        valores = [
+            jogador['Gols_90min'],
+            jogador['Assistências_90min'],
+            jogador['Eficiencia_Finalizacao'],
+            jogador['Fator_Regularidade']
+        ]
+        valores_norm = []
+        max_vals = [1.2, 0.8, 2.0, 1.0]
+        for v, max_v in zip(valores, max_vals):
+            valores_norm.append(min(v/max_v, 1.0))
+
+        angles = np.linspace(0, 2 * np.pi, len(metricas), endpoint=False).tolist()
+        valores_norm += valores_norm[:1]
+        angles += angles[:1]
+        cores_ranking = ['#FFD700', '#C0C0C0', '#CD7F32', '#4CAF50', '#2196F3']
+        cor = cores_ranking[idx]
+
+        ax.plot(angles, valores_norm, 'o-', linewidth=3, color=cor, markersize=8)
+        ax.fill(angles, valores_norm, alpha=0.3, color=cor)
+        ax.set_xticks(angles[:-1])
+        ax.set_xticklabels(metricas, fontsize=10, weight='bold')
+        ax.set_ylim(0, 1)
+        ax.set_yticks([0.25, 0.5, 0.75, 1.0])
+        ax.set_yticklabels(['25%', '50%', '75%', '100%'], fontsize=9)
+        ax.grid(True, alpha=0.4)
+        nome_curto = jogador['Nome'].split()[0] if len(jogador['Nome'].split()) > 1 else jogador['Nome'][:12]
+        titulo = (f"#{idx+1}º {nome_curto}\n"
+                 f"{jogador['Liga'].replace('_', ' ')}\n"
+                 f"Pontuação: {jogador['Score_Ponderado']:.2f}\n"
+                 f"{jogador['Jogos']} jogos em {jogador['Temporada']}")
+
+        ax.set_title(titulo, fontsize=12, fontweight='bold', pad=20)
+        ax.patch.set_facecolor(cor)
+        ax.patch.set_alpha(0.1)
+
+    fig.suptitle('TOP 5 ATACANTES - PERFIL DE DESEMPENHO\nAnálise das Métricas Essenciais para Tomada de Decisão',
+                 fontsize=16, fontweight='bold', y=0.95)
+    fig.tight_layout(rect=[0, 0, 1, 0.92])
+    fig.savefig(caminho, dpi=dpi, bbox_inches='tight')
+
+def criar_comparativo_jogadores(shortlist, df_fwd, caminho, dpi=300):
+    fig = _nova_figura(figsize=(16, 10))
+    ax = fig.subplots(1, 1)
+
+    top10 = shortlist.head(10)
+    media_mercado = df_fwd['Gols_90min'].mean()
+    cores = ['gold' if score > media_mercado*1.5 else
+             'lightgreen' if score > media_mercado*1.2 else
+             'orange' for score in top10['Gols_90min']]
+
+    bars = ax.barh(range(len(top10)), top10['Gols_90min'],
+                   color=cores, alpha=0.8, edgecolor='black', linewidth=2)
+    ax.axvline(x=media_mercado, color='red', linestyle='--', linewidth=3,
+               label=f'MÉDIA DO MERCADO: {media_mercado:.2f} gols/90min')
+    labels = []
+    for i, (_, jogador) in enumerate(top10.iterrows()):
+        diferenca_pct = ((jogador['Gols_90min'] / media_mercado) - 1) * 100
+        nome_curto = jogador['Nome'][:20] if len(jogador['Nome']) <= 20 else jogador['Nome'][:17] + "..."
+        label = f"#{i+1} {nome_curto}\n{jogador['Liga'].replace('_', ' ')} | +{diferenca_pct:.0f}% vs mercado"
+        labels.append(label)
+
+    ax.set_yticks(range(len(top10)))
+    ax.set_yticklabels(labels, fontsize=11)
+    ax.set_xlabel('GOLS POR 90 MINUTOS', fontweight='bold', fontsize=14)
+    for i, (bar, (_, jogador)) in enumerate(zip(bars, top10.iterrows())):
+        width = bar.get_width()
+        ax.text(width + 0.02, bar.get_y() + bar.get_height()/2,
+                f'{width:.2f}', ha='left', va='center', fontweight='bold', fontsize=12)
+    ax.set_title('🎯 IMPACTO DA ANÁLISE DE DADOS NO RECRUTAMENTO\n' +
+                 f'TOP 10 ATACANTES: {top10["Gols_90min"].mean():.2f} vs MERCADO: {media_mercado:.2f} gols/90min\n' +
+                 f'MELHORIA DE {((top10["Gols_90min"].mean() / media_mercado - 1) * 100):.0f}% NA PRODUTIVIDADE',
+                 fontsize=18, fontweight='bold', pad=20)
+    ax.legend(fontsize=12, loc='lower right')
+    ax.grid(True, alpha=0.3, axis='x')
+    ax.set_xlim(0, max(top10['Gols_90min']) * 1.15)
+    textstr = f'''VALIDAÇÃO CIENTÍFICA:
+• Amostra analisada: {len(df_fwd):,} atacantes
+• Taxa de seleção: {(len(shortlist)/len(df_fwd)*100):.1f}%
+• Performance superior: +{((shortlist["Gols_90min"].mean() / media_mercado - 1) * 100):.0f}%'''
+
+    props = dict(boxstyle='round', facecolor='lightblue', alpha=0.8)
+    ax.text(0.02, 0.98, textstr, transform=ax.transAxes, fontsize=11,
+            verticalalignment='top', bbox=props)
+
+    fig.tight_layout()
+    fig.savefig(caminho, dpi=dpi, bbox_inches='tight')
+
+def criar_analise_mercado_ligas(shortlist, df_fwd, caminho, dpi=300):
+    fig = _nova_figura(figsize=(16, 10))
+    ax = fig.subplots(1, 1)
+    ligas_ordenadas = ['Ligue_1', 'Serie_A', 'Bundesliga', 'La_Liga', 'epl']
+    nomes_ligas = ['Ligue 1\n(França)', 'Serie A\n(Itália)', 'Bundesliga\n(Alemanha)',
+                   'La Liga\n(Espanha)', 'Premier League\n(Inglaterra)']
+    dados_liga = []
+    for liga in ligas_ordenadas:
+        shortlist_liga = shortlist[shortlist['Liga'] == liga]
+        mercado_liga = df_fwd[df_fwd['Liga'] == liga]
+
+        if len(shortlist_liga) > 0:
+            cb_medio = shortlist_liga['Custo_Beneficio'].mean()
+            taxa_selecao = (len(shortlist_liga) / len(mercado_liga)) * 100 if len(mercado_liga) > 0 else 0
+            score_medio = shortlist_liga['Score_Ponderado'].mean()
+
+            dados_liga.append({
+                'liga': liga,
+                'nome': nomes_ligas[ligas_ordenadas.index(liga)],
+                'cb': cb_medio,
+                'taxa': taxa_selecao,
+                'score': score_medio,
+                'jogadores': len(shortlist_liga)
+            })
+    dados_liga.sort(key=lambda x: x['cb'], reverse=True)
+    cores = []
+    for dado in dados_liga:
+        if dado['cb'] > 0.95:
+            cores.append('gold')
+        elif dado['cb'] > 0.90:
+            cores.append('lightgreen')
+        else:
+            cores.append('orange')
+    y_pos = range(len(dados_liga))
+    valores_cb = [d['cb'] for d in dados_liga]
+
+    bars = ax.barh(y_pos, valores_cb, color=cores, alpha=0.8, edgecolor='black', linewidth=2)
+    labels = []
+    for dado in dados_liga:
+        label = f"{dado['nome']}\n{dado['jogadores']} jogadores | Taxa: {dado['taxa']:.1f}%"
+        labels.append(label)
+
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(labels, fontsize=12)
+    ax.set_xlabel('CUSTO-BENEFÍCIO MÉDIO (Pontuação/Fator Liga)', fontweight='bold', fontsize=14)
+
+    for i, (bar, dado) in enumerate(zip(bars, dados_liga)):
+        width = bar.get_width()
+        ax.text(width + 0.05, bar.get_y() + bar.get_height()/2,
+                f'{width:.2f}', ha='left', va='center', fontweight='bold', fontsize=13)
+
+    melhor_liga = dados_liga[0]['nome'].split('\n')[0]
+
+    ax.set_title('ANÁLISE DE OPORTUNIDADES DE MERCADO POR LIGA\n' +
+                 f'MELHOR CUSTO-BENEFÍCIO: {melhor_liga} ({dados_liga[0]["cb"]:.2f})\n',
+                 fontsize=18, fontweight='bold', pad=20)
+
+    ax.grid(True, alpha=0.3, axis='x')
+    ax.set_xlim(0, max(valores_cb) * 1.15)
+
+    textstr = f'''INSIGHTS ESTRATÉGICOS:
+        • {dados_liga[0]['nome'].split()[0]}: Melhor C/B ({dados_liga[0]['cb']:.2f}) - PRIORIDADE
+        • {dados_liga[1]['nome'].split()[0]}: 2ª melhor ({dados_liga[1]['cb']:.2f}) - Alternativa
+        • Total analisado: {len(df_fwd):,} atacantes de 5 ligas'''
+
+    props = dict(boxstyle='round', facecolor='lightcyan', alpha=0.9)
+    ax.text(0.02, 0.98, textstr, transform=ax.transAxes, fontsize=12,
+            verticalalignment='top', bbox=props)
+
+    fig.tight_layout()
+    fig.savefig(caminho, dpi=dpi, bbox_inches='tight')
+
+def criar_relatorio_executivo_simples(shortlist, df_fwd, caminho, dpi=300):
+    fig = _nova_figura(figsize=(14, 10))
+    ax1, ax2 = fig.subplots(2, 1, gridspec_kw={'height_ratios': [1, 3]})
+    ax1.axis('off')
+
+    kpis = {
+        'Atacantes Analisados': len(df_fwd),
+        'Lista Final': len(shortlist),
+        'Pontuação Média': f"{shortlist['Score_Ponderado'].mean():.2f}",
+        'Melhor C/B': f"{shortlist['Custo_Beneficio'].max():.2f}",
+        'Ligas Cobertas': shortlist['Liga'].nunique()
+    }
+
+    kpi_text = "  •  ".join([f"{k}: {v}" for k, v in kpis.items()])
+
+    ax1.text(0.5, 0.5, f"INDICADORES PRINCIPAIS\n{kpi_text}",
+             transform=ax1.transAxes, fontsize=12, fontweight='bold',
+             ha='center', va='center',
+             bbox=dict(boxstyle="round,pad=0.8", facecolor="lightblue", alpha=0.8))
+    ax2.axis('off')
+
+    table_data = []
+    for idx, (_, jogador) in enumerate(shortlist.head(10).iterrows(), 1):
+        table_data.append([
+            f"{idx}º",
+            jogador['Nome'][:16],
+            jogador['Time'].split()[0] if len(jogador['Time']) > 15 else jogador['Time'],
+            f"{jogador['Gols_90min']:.2f}",
+            f"{jogador['Assistências_90min']:.2f}",
+            f"{jogador['Score_Ponderado']:.2f}",
+            f"{jogador['Custo_Beneficio']:.2f}"
+        ])
+
+    table = ax2.table(cellText=table_data,
+                     colLabels=['Pos', 'Jogador', 'Clube', 'Gols/90',
+                               'Assist/90', 'Pontuação', 'C/B'],
+                     cellLoc='center', loc='center',
+                     bbox=[0, 0, 1, 1])
+
+    table.auto_set_font_size(False)
+    table.set_fontsize(10)
+    table.scale(1, 2)
+    for (i, j), cell in table.get_celld().items():
+        if i == 0:
+            cell.set_text_props(weight='bold', color='white')
+            cell.set_facecolor('#2C3E50')
+        else:
+            cell.set_facecolor('#F8F8FF' if i % 2 == 0 else 'white')
+        cell.set_edgecolor('black')
+        cell.set_linewidth(0.8)
+
+    fig.suptitle('RELATÓRIO EXECUTIVO - ANÁLISE DE DADOS PARA RECRUTAMENTO',
+                 fontsize=16, fontweight='bold', y=0.95)
+    fig.savefig(caminho, dpi=dpi, bbox_inches='tight')
+
+
+# nome do arquivo -> (função, colunas da shortlist, colunas de df_fwd)
+DASHBOARDS = {
+    '01_matriz_decisao_jogadores': (
+        criar_dashboard_matriz_decisao,
+        ['Nome', 'Time', 'Liga', 'Jogos', 'Gols_90min', 'Assistências_90min', 'Score_Ponderado', 'Custo_Beneficio'],
+        [],
+    ),
+    '02_perfil_top5_jogadores': (
+        criar_perfil_individual_top5,
+        ['Nome', 'Liga', 'Jogos', 'Temporada', 'Gols_90min', 'Assistências_90min',
+         'Eficiencia_Finalizacao', 'Fator_Regularidade', 'Score_Ponderado'],
+        [],
+    ),
+    '03_comparativo_detalhado_jogadores': (
+        criar_comparativo_jogadores,
+        ['Nome', 'Liga', 'Gols_90min'],
+        ['Gols_90min'],
+    ),
+    '04_analise_mercado_ligas': (
+        criar_analise_mercado_ligas,
+        ['Liga', 'Score_Ponderado', 'Custo_Beneficio'],
+        ['Liga'],
+    ),
+    'relatorio_executivo_academico': (
+        criar_relatorio_executivo_simples,
+        ['Nome', 'Time', 'Liga', 'Gols_90min', 'Assistências_90min', 'Score_Ponderado', 'Custo_Beneficio'],
+        [],
+    ),
+}
+
+
+MANIFESTO_DASHBOARDS = "dashboards_manifesto.json"
+
+
+@lru_cache(maxsize=None)
+def _codigo_graficos():
+    # O módulo inteiro: além da função do gráfico, cores, ESTILO e _nova_figura afetam a imagem
+    return inspect.getsource(sys.modules[__name__]).encode()
+
+
+def hash_dashboard(nome, shortlist, df_fwd, formato, dpi):
+    """Hash do conteúdo que define um dashboard: dados de entrada, parâmetros e código deste módulo."""
+    h = hashlib.sha256()
+    h.update(json.dumps([nome, formato, dpi, matplotlib.__version__]).encode())
+    h.update(_codigo_graficos())
+    for dados in (shortlist, df_fwd):
+        h.update(json.dumps([list(map(str, dados.columns)), list(map(str, dados.dtypes)), len(dados)]).encode())
+        if len(dados.columns) > 0:
+            h.update(pd.util.hash_pandas_object(dados, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _ler_manifesto(caminho):
+    try:
+        with open(caminho, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'dashboards': {}}
+
+
+def _renderizar(nome, shortlist, df_fwd, caminho, dpi):
+    funcao = DASHBOARDS[nome][0]
+    inicio_parede, inicio_cpu = time.perf_counter(), time.process_time()
+    with matplotlib.rc_context(ESTILO):
+        funcao(shortlist, df_fwd, caminho, dpi)
+    return {'parede_s': time.perf_counter() - inicio_parede, 'cpu_s': time.process_time() - inicio_cpu,
+            'linhas': len(shortlist), 'pid': os.getpid()}
+
+
+def renderizar_dashboards(shortlist, df_fwd, diretorio='.', formato='png', dpi=300, processos=None,
+                          nomes=None, usar_cache=True):
+    """Gera os dashboards em processos paralelos e devolve os caminhos gravados.
+
+    Cada worker recebe apenas as colunas que o seu gráfico usa. `formato='none'` não
+    gera nada e `processos=1` renderiza no próprio processo. Com `usar_cache`, um
+    dashboard cujo hash de entrada (ver `hash_dashboard`) não mudou desde a última
+    execução é reaproveitado; o manifesto registra o que foi regenerado.
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato inválido: {formato!r} (use {', '.join(FORMATOS)})")
+    if formato == 'none':
+        return []
+
+    os.makedirs(diretorio, exist_ok=True)
+    caminho_manifesto = os.path.join(diretorio, MANIFESTO_DASHBOARDS)
+    manifesto = _ler_manifesto(caminho_manifesto)
+    nomes = list(DASHBOARDS) if nomes is None else nomes
+    caminhos = []
+    tarefas = []
+    hashes = {}
+    reutilizados = []
+    for nome in nomes:
+        _, colunas_shortlist, colunas_fwd = DASHBOARDS[nome]
+        caminho = os.path.join(diretorio, f"{nome}.{formato}")
+        dados = (shortlist[colunas_shortlist], df_fwd[colunas_fwd])
+        caminhos.append(caminho)
+        chave = f"{nome}.{formato}"
+        hashes[chave] = hash_dashboard(nome, *dados, formato, dpi)
+        anterior = manifesto['dashboards'].get(chave)
+        if usar_cache and anterior and anterior['hash'] == hashes[chave] and os.path.exists(caminho):
+            reutilizados.append(chave)
+            continue
+        tarefas.append((nome, *dados, caminho, dpi))
+
+    if processos == 1 or len(tarefas) <= 1:
+        tempos = [_renderizar(*tarefa) for tarefa in tarefas]
+    else:
+        # workers herdados via fork não precisam do tracemalloc do relatório de execução
+        with ProcessPoolExecutor(max_workers=processos or min(len(tarefas), os.cpu_count() or 1),
+                                 initializer=tracemalloc.stop) as pool:
+            tempos = list(pool.map(_renderizar, *zip(*tarefas)))
+    for (nome, *_), tempo in zip(tarefas, tempos):
+        registrar('grafico', nome, formato=formato, dpi=dpi, **tempo)
+
+    agora = time.time()
+    regenerados = [f"{nome}.{formato}" for nome, *_ in tarefas]
+    for chave in regenerados:
+        manifesto['dashboards'][chave] = {'hash': hashes[chave], 'gerado_em': agora}
+    manifesto['ultima_execucao'] = {'em': agora, 'regenerados': regenerados, 'reutilizados': reutilizados}
+    with open(caminho_manifesto, "w", encoding="utf-8") as f:
+        json.dump(manifesto, f, indent=2, ensure_ascii=False)
+    print(f"Dashboards: {len(regenerados)} regenerados, {len(reutilizados)} reaproveitados")
+    return caminhos
@@ -0,0 +1,139 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from analise_atacantes.score import FEATURES, PESOS_PADRAO, calcular_features, matriz_pesos
+
+REAMOSTRAS_PADRAO = 2000
+CONFIANCA_PADRAO = 0.90
+# Reamostras por lote: limita a memória dos temporários (lote x jogadores x 8 bytes por array)
+TAMANHO_LOTE = 250
+# Com muitos jogadores o lote encolhe para no máximo este número de elementos por array
+MAX_ELEMENTOS_LOTE = 4_000_000
+
+
+def _posicoes(scores):
+    """Posição (1 = melhor) de cada coluna em cada linha; empates pela ordem das colunas."""
+    ordem = np.argsort(-scores, axis=1, kind='stable')
+    posicoes = np.empty(ordem.shape, dtype='int32')
+    np.put_along_axis(posicoes, ordem, np.arange(1, scores.shape[1] + 1, dtype='int32')[None, :], axis=1)
+    return posicoes
+
+
+def _selecionados(scores, posicoes, top_n, ligas, max_por_liga):
+    """Máscara (b, n_jogadores) de quem entra na shortlist em cada reamostra.
+
+    Com `max_por_liga` segue `selecao.top_k_com_cota`: só os `max_por_liga` melhores de
+    cada liga concorrem, e deles entram os `top_n` melhores.
+    """
+    if max_por_liga is None:
+        return posicoes <= top_n
+    elegiveis = np.empty(scores.shape, dtype=bool)
+    for codigo in np.unique(ligas):
+        colunas = np.flatnonzero(ligas == codigo)
+        elegiveis[:, colunas] = _posicoes(scores[:, colunas]) <= max_por_liga
+    return elegiveis & (_posicoes(np.where(elegiveis, scores, -np.inf)) <= top_n)
+
+
+def _reamostrar_lote(totais, constantes, pesos, semente, b, top_n, ligas, max_por_liga):
+    """Scores (float32) e posições (int32) de `b` reamostras, ambos (b, n_jogadores), e
+    quantas vezes cada jogador entrou na shortlist."""
+    rng = np.random.default_rng(semente)
+    gols, assistencias, passes = (rng.poisson(t, size=(b, len(t))) for t in totais)
+    fator_90, xg, regularidade = constantes
+
+    gols_90 = gols * fator_90
+    features = {
+        'Gols_90min': gols_90,
+        'Impacto_Ofensivo': gols_90 + assistencias * fator_90 * 0.8,
+        'Eficiencia_Finalizacao': gols / xg,
+        'Key_Passes_90min': passes * fator_90,
+    }
+    scores = sum(peso * features[f] for f, peso in zip(FEATURES, pesos)) * regularidade
+    posicoes = _posicoes(scores)
+    selecoes = _selecionados(scores, posicoes, top_n, ligas, max_por_liga).sum(axis=0)
+    return scores.astype('float32'), posicoes, selecoes
+
+
+def _quantis(amostras, caudas, **kwargs):
+    """np.quantile por coluna em blocos, sem copiar a matriz de reamostras inteira."""
+    bloco = max(1, MAX_ELEMENTOS_LOTE // len(amostras))
+    return np.concatenate([np.quantile(amostras[:, inicio:inicio + bloco], caudas, axis=0, **kwargs)
+                           for inicio in range(0, amostras.shape[1], bloco)], axis=1)
+
+
+def bootstrap_score(df_fwd, reamostras: int = REAMOSTRAS_PADRAO, pesos=PESOS_PADRAO,
+                    confianca: float = CONFIANCA_PADRAO, top_n: int = 10, semente: int = 42,
+                    processos: int = None, max_por_liga: int = None):
+    """Intervalos de confiança do Score_Ponderado e da posição de cada atacante no ranking.
+
+    Bootstrap paramétrico: em cada reamostra gols, assistências e passes-chave são
+    sorteados de Poisson com média igual ao total observado (minutos, xG e fator de
+    regularidade ficam fixos), e o score é recalculado com as mesmas fórmulas de
+    `score.py`. Assim quem tem poucos minutos, e portanto poucos eventos, recebe
+    intervalos mais largos. As reamostras rodam em lotes matriciais de até TAMANHO_LOTE
+    (menos com muitos jogadores, ver MAX_ELEMENTOS_LOTE); com `processos` > 1 os lotes
+    são distribuídos num pool de processos. Cada lote tem sua própria semente derivada
+    de `semente`, então o resultado não depende de `processos`.
+
+    Retorna um DataFrame indexado como `df_fwd` com Score_IC_Inf/Sup, Posicao_Ranking
+    (posição pelo Score_Ponderado, sem cota por liga), Posicao_Ranking_IC_Inf/Sup e
+    Prob_Top_N: fração das reamostras em que o jogador entra na shortlist de `top_n`,
+    respeitando `max_por_liga` como `selecao.criar_shortlist_final`.
+    """
+    pesos = matriz_pesos(pesos)[1][0]
+    features = calcular_features(df_fwd)
+    minutos = df_fwd['Minutos'].to_numpy(dtype='float64')
+    totais = tuple(df_fwd[c].to_numpy(dtype='float64') for c in ['Gols', 'Assistências', 'Passes-chave'])
+    regularidade = (df_fwd['Fator_Regularidade'] if 'Fator_Regularidade' in df_fwd
+                    else features['Fator_Regularidade']).to_numpy(dtype='float64')
+    constantes = (np.divide(90.0, minutos, out=np.zeros_like(minutos), where=minutos > 0),
+                  df_fwd['xG'].replace(0, 0.1).to_numpy(dtype='float64'), regularidade)
+    ligas = pd.factorize(df_fwd['Liga'])[0] if max_por_liga is not None else None
+
+    lote = max(1, min(TAMANHO_LOTE, MAX_ELEMENTOS_LOTE // max(1, len(df_fwd))))
+    tamanhos = [lote] * (reamostras // lote)
+    if reamostras % lote:
+        tamanhos.append(reamostras % lote)
+    sementes = np.random.SeedSequence(semente).spawn(len(tamanhos))
+    argumentos = [(totais, constantes, pesos, s, b, top_n, ligas, max_por_liga)
+                  for s, b in zip(sementes, tamanhos)]
+
+    # Matrizes pré-alocadas: os lotes são copiados nelas à medida que chegam
+    scores = np.empty((reamostras, len(df_fwd)), dtype='float32')
+    posicoes = np.empty((reamostras, len(df_fwd)), dtype='int32')
+    selecoes = np.zeros(len(df_fwd), dtype='int64')
+    executor = ProcessPoolExecutor(processos) if processos and processos > 1 else None
+    try:
+        lotes = executor.map(_reamostrar_lote, *zip(*argumentos)) if executor else (
+            _reamostrar_lote(*a) for a in argumentos)
+        inicio = 0
+        for scores_lote, posicoes_lote, selecoes_lote in lotes:
+            scores[inicio:inicio + len(scores_lote)] = scores_lote
+            posicoes[inicio:inicio + len(posicoes_lote)] = posicoes_lote
+            selecoes += selecoes_lote
+            inicio += len(scores_lote)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    caudas = [(1 - confianca) / 2, (1 + confianca) / 2]
+    ic_score = _quantis(scores, caudas)
+    ic_posicao = _quantis(posicoes, caudas, method='nearest')
+    if 'Score_Ponderado' in df_fwd:
+        pontual = df_fwd['Score_Ponderado'].to_numpy(dtype='float64')
+    else:
+        pontual = features[FEATURES].to_numpy(dtype='float64') @ pesos * regularidade
+    ordem = np.argsort(-pontual, kind='stable')
+    posicao = np.empty(len(ordem), dtype='int64')
+    posicao[ordem] = np.arange(1, len(ordem) + 1)
+
+    return pd.DataFrame({
+        'Score_IC_Inf': ic_score[0],
+        'Score_IC_Sup': ic_score[1],
+        'Posicao_Ranking': posicao,
+        'Posicao_Ranking_IC_Inf': ic_posicao[0].astype('int64'),
+        'Posicao_Ranking_IC_Sup': ic_posicao[1].astype('int64'),
+        'Prob_Top_N': selecoes / reamostras,
+    }, index=df_fwd.index)
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+
+# Campo do payload do Understat -> (coluna do DataFrame, dtype)
+CAMPOS_UNDERSTAT = {
+    'id': ('Id', 'int64'),
+    'player_name': ('Nome', 'object'),
+    'team_title': ('Time', 'object'),
+    'position': ('Posição', 'object'),
+    'goals': ('Gols', 'int64'),
+    'assists': ('Assistências', 'int64'),
+    'xG': ('xG', 'float64'),
+    'xA': ('xA', 'float64'),
+    'shots': ('Finalizações', 'int64'),
+    'key_passes': ('Passes-chave', 'int64'),
+    'time': ('Minutos', 'int64'),
+    'games': ('Jogos', 'int64'),
+}
+
+# Coluna por 90min -> coluna de totais
+COLUNAS_90MIN = {
+    'Gols_90min': 'Gols',
+    'Assistências_90min': 'Assistências',
+    'xG_90min': 'xG',
+    'xA_90min': 'xA',
+    'Shots_90min': 'Finalizações',
+    'Key_Passes_90min': 'Passes-chave',
+}
+
+
+def calcular_por_90(df, casas: int = 2):
+    """Preenche todas as colunas por 90min de uma vez (0 para quem não tem minutos)."""
+    minutos = df['Minutos'].to_numpy(dtype='float64')
+    fator = np.divide(90.0, minutos, out=np.zeros_like(minutos), where=minutos > 0)
+    totais = df[list(COLUNAS_90MIN.values())].to_numpy(dtype='float64')
+    valores = np.round(totais * fator[:, None], casas)
+    for i, coluna in enumerate(COLUNAS_90MIN):
+        df[coluna] = valores[:, i]
+    return df
+
+
+def parse_jogadores(players, league: str, season: int):
+    """Converte o payload bruto de `get_league_players` em (df, rejeitados).
+
+    Linhas com campos ausentes ou não numéricos vão para `rejeitados`, com a lista
+    dos campos problemáticos em `Erro`.
+    """
+    bruto = pd.DataFrame.from_records(players, columns=list(CAMPOS_UNDERSTAT))
+    df = pd.DataFrame(index=bruto.index)
+    invalidos = pd.DataFrame(False, index=bruto.index, columns=list(CAMPOS_UNDERSTAT))
+
+    for campo, (coluna, dtype) in CAMPOS_UNDERSTAT.items():
+        if dtype == 'object':
+            df[coluna] = bruto[campo]
+            invalidos[campo] = bruto[campo].isna()
+            continue
+        valores = pd.to_numeric(bruto[campo], errors='coerce')
+        invalidos[campo] = valores.isna()
+        if dtype == 'int64':
+            invalidos[campo] |= valores.notna() & (valores % 1 != 0)
+        df[coluna] = valores
+
+    mascara = invalidos.any(axis=1)
+    rejeitados = bruto[mascara].copy()
+    rejeitados['Erro'] = [', '.join(invalidos.columns[linha])
+                          for linha in invalidos[mascara].to_numpy()]
+    rejeitados['Liga'] = league
+    rejeitados['Temporada'] = season
+
+    df = df[~mascara].astype({coluna: dtype for coluna, dtype in CAMPOS_UNDERSTAT.values()})
+    df = calcular_por_90(df)
+    df['xG'] = df['xG'].round(2)
+    df['xA'] = df['xA'].round(2)
+    df['Liga'] = league
+    df['Temporada'] = season
+    return df.reset_index(drop=True), rejeitados.reset_index(drop=True)
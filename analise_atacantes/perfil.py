@@ -0,0 +1,95 @@
+import contextvars
+import json
+import os
+import platform
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+_relatorio_atual = contextvars.ContextVar('relatorio_atual', default=None)
+
+
+class RelatorioExecucao:
+    """Coleta medições (tempo de parede, CPU, pico de memória, linhas) de uma execução.
+
+    Enquanto `ativo()` estiver aberto, `medir` e `registrar` chamados em qualquer ponto
+    do código (inclusive em tasks asyncio) gravam neste relatório; fora dele são no-ops.
+    O pico de memória vem do tracemalloc e cobre apenas alocações Python/NumPy.
+    """
+
+    def __init__(self, memoria: bool = True):
+        self.memoria = memoria
+        self.medicoes = []
+        self.inicio = time.time()
+        self._picos = []
+
+    @contextmanager
+    def ativo(self):
+        token = _relatorio_atual.set(self)
+        iniciou_tracemalloc = self.memoria and not tracemalloc.is_tracing()
+        if iniciou_tracemalloc:
+            tracemalloc.start()
+        try:
+            yield self
+        finally:
+            if iniciou_tracemalloc:
+                tracemalloc.stop()
+            _relatorio_atual.reset(token)
+
+    def registrar(self, categoria: str, nome: str, **dados):
+        self.medicoes.append({'categoria': categoria, 'nome': nome, **dados})
+
+    def como_dict(self):
+        return {
+            'inicio': self.inicio,
+            'duracao_s': time.time() - self.inicio,
+            'python': platform.python_version(),
+            'medicoes': self.medicoes,
+        }
+
+    def salvar(self, caminho: str):
+        os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(self.como_dict(), f, indent=2, ensure_ascii=False, default=str)
+
+
+def registrar(categoria: str, nome: str, **dados):
+    relatorio = _relatorio_atual.get()
+    if relatorio is not None:
+        relatorio.registrar(categoria, nome, **dados)
+
+
+@contextmanager
+def medir(categoria: str, nome: str, **dados):
+    """Mede o bloco e registra no relatório ativo; o chamador pode preencher o dict devolvido
+    (ex.: `registro['linhas'] = len(df)`). Não usar em código concorrente: CPU e memória
+    são do processo inteiro.
+    """
+    relatorio = _relatorio_atual.get()
+    registro = dict(dados)
+    if relatorio is None:
+        yield registro
+        return
+
+    memoria = tracemalloc.is_tracing()
+    if memoria:
+        atual, pico = tracemalloc.get_traced_memory()
+        # guarda o pico do bloco externo antes de zerar para o bloco atual
+        if relatorio._picos:
+            relatorio._picos[-1] = max(relatorio._picos[-1], pico)
+        relatorio._picos.append(0)
+        tracemalloc.reset_peak()
+        inicio_memoria = atual
+    inicio_parede = time.perf_counter()
+    inicio_cpu = time.process_time()
+    try:
+        yield registro
+    finally:
+        registro['parede_s'] = time.perf_counter() - inicio_parede
+        registro['cpu_s'] = time.process_time() - inicio_cpu
+        if memoria:
+            pico = max(relatorio._picos.pop(), tracemalloc.get_traced_memory()[1])
+            registro['pico_memoria_mb'] = (pico - inicio_memoria) / 2 ** 20
+            if relatorio._picos:
+                relatorio._picos[-1] = max(relatorio._picos[-1], pico)
+        relatorio.registrar(categoria, nome, **registro)
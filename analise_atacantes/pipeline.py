@@ -0,0 +1,239 @@
+"""Pipeline de análise em etapas: coletar → consolidar → filtrar → forma → pontuar → incerteza →
+indexar → selecionar → renderizar → exportar.
+
+Cada etapa recebe o estado acumulado (dict) e a configuração e importa suas dependências
+pesadas (sqlalchemy, aiohttp/understat, matplotlib) só quando executada.
+"""
+import argparse
+import cProfile
+import os
+from dataclasses import dataclass, field
+
+from analise_atacantes.coleta import LIGAS
+from analise_atacantes.perfil import RelatorioExecucao, medir
+
+ETAPAS = ['coletar', 'consolidar', 'filtrar', 'forma', 'pontuar', 'incerteza', 'indexar', 'selecionar',
+          'renderizar', 'exportar']
+
+ARQUIVO_SHORTLIST = 'shortlist_atacantes_academica.csv'
+ARQUIVO_RELATORIO = 'relatorio_execucao.json'
+
+# Chave do estado cujo tamanho é registrado como `linhas` ao fim de cada etapa
+SAIDA_ETAPAS = {
+    'coletar': 'df',
+    'consolidar': 'df',
+    'filtrar': 'df_fwd',
+    'forma': 'forma',
+    'pontuar': 'df_fwd',
+    'incerteza': 'df_fwd',
+    'indexar': 'df_fwd',
+    'selecionar': 'shortlist',
+    'renderizar': 'dashboards',
+    'exportar': 'shortlist',
+}
+
+
+@dataclass
+class Configuracao:
+    ligas: list = field(default_factory=lambda: list(LIGAS))
+    temporadas: list = field(default_factory=lambda: [2024])
+    # String de conexão SQLAlchemy (SQL Server, SQLite, ...); por padrão um SQLite local
+    db_url: str = field(default_factory=lambda: os.environ.get(
+        "ATACANTES_DB_URL", "sqlite:///estatisticas_understat.db"))
+    offline: bool = field(default_factory=lambda: os.environ.get("ATACANTES_OFFLINE") == "1")
+    diretorio_saida: str = '.'
+    formato: str = field(default_factory=lambda: os.environ.get("ATACANTES_FORMATO", "png"))
+    dpi: int = field(default_factory=lambda: int(os.environ.get("ATACANTES_DPI", "300")))
+    processos: int = None
+    n_jogadores: int = 10
+    max_por_liga: int = None
+    # Índice de similaridade/percentis persistido junto ao cache local (None = não atualiza)
+    diretorio_indice: str = field(default_factory=lambda: os.path.join('cache_understat', 'indice'))
+    # Tamanho da janela de forma (últimas N partidas); None = score só com dados da temporada
+    janela_forma: int = None
+    diretorio_forma: str = field(default_factory=lambda: os.path.join('cache_understat', 'forma'))
+    # Formatos da exportação particionada (tabela completa e shortlist) em <saida>/exportacao
+    formatos_exportacao: list = field(default_factory=lambda: ['parquet', 'csv', 'json'])
+    # Reamostras do bootstrap dos intervalos de score/posição (0 = não calcula)
+    reamostras: int = 2000
+
+
+def etapa_coletar(estado, config):
+    from analise_atacantes.carga import carregar_dados
+    from analise_atacantes.tipos import compactar
+
+    engine = None
+    if not config.offline:
+        from analise_atacantes.armazenamento import criar_engine
+        engine = criar_engine(config.db_url)
+    estado['df'] = compactar(carregar_dados(engine, config.ligas, config.temporadas, offline=config.offline))
+
+
+def etapa_consolidar(estado, config):
+    from analise_atacantes.consolidacao import consolidar_transferencias
+    from analise_atacantes.tipos import compactar
+
+    estado['df'] = compactar(consolidar_transferencias(estado['df']))
+
+
+def etapa_filtrar(estado, config):
+    from analise_atacantes.filtros import aplicar_filtros_realistas, clubes_grandes
+
+    estado['df_fwd'] = aplicar_filtros_realistas(estado['df'], clubes_grandes)
+
+
+def etapa_forma(estado, config):
+    if config.janela_forma is None:
+        return
+    from analise_atacantes.forma import atualizar_forma
+
+    df_fwd = estado['df_fwd']
+    pares = df_fwd[['Id', 'Temporada']].drop_duplicates().itertuples(index=False)
+    forma = atualizar_forma(pares, config.diretorio_forma, config.janela_forma, offline=config.offline)
+    estado['forma'] = forma
+    estado['df_fwd'] = df_fwd.merge(forma.drop(columns='Ultima_Partida'), on=['Id', 'Temporada'],
+                                    how='left').set_axis(df_fwd.index)
+    if len(df_fwd) and estado['df_fwd']['Partidas_Janela'].isna().all():
+        print("Aviso: nenhum atacante tem janela de forma na sua temporada; score sem forma recente")
+
+
+def etapa_pontuar(estado, config):
+    from analise_atacantes.score import pontuar_atacantes
+
+    df_fwd = estado['df_fwd']
+    estado['df_fwd'] = pontuar_atacantes(df_fwd, regularidade=df_fwd.get('Fator_Regularidade_Recente'))
+
+
+def etapa_incerteza(estado, config):
+    if not config.reamostras:
+        return
+    from analise_atacantes.incerteza import bootstrap_score
+
+    df_fwd = estado['df_fwd']
+    estado['df_fwd'] = df_fwd.join(bootstrap_score(df_fwd, config.reamostras, top_n=config.n_jogadores,
+                                                   processos=config.processos,
+                                                   max_por_liga=config.max_por_liga))
+
+
+def etapa_indexar(estado, config):
+    if config.diretorio_indice is None:
+        return
+    from analise_atacantes.similaridade import atualizar_indice
+
+    estado['indice'] = atualizar_indice(estado['df_fwd'], config.diretorio_indice)
+
+
+def etapa_selecionar(estado, config):
+    from analise_atacantes.selecao import criar_shortlist_final
+
+    estado['shortlist'] = criar_shortlist_final(estado['df_fwd'], config.n_jogadores, config.max_por_liga)
+
+
+def etapa_renderizar(estado, config):
+    if config.formato == 'none':
+        return
+    from analise_atacantes.graficos import renderizar_dashboards
+
+    estado['dashboards'] = renderizar_dashboards(estado['shortlist'], estado['df_fwd'],
+                                                 config.diretorio_saida, config.formato,
+                                                 config.dpi, config.processos)
+
+
+def etapa_exportar(estado, config):
+    from analise_atacantes.exportacao import DIRETORIO_EXPORTACAO, exportar_resultados
+
+    estado['shortlist'].to_csv(os.path.join(config.diretorio_saida, ARQUIVO_SHORTLIST), index=False)
+    if config.formatos_exportacao:
+        estado['exportacao'] = exportar_resultados(
+            {'atacantes': estado['df_fwd'], 'shortlist': estado['shortlist']},
+            os.path.join(config.diretorio_saida, DIRETORIO_EXPORTACAO), config.formatos_exportacao,
+            substituir=['shortlist'],
+            escopo=[(temporada, liga) for temporada in config.temporadas for liga in config.ligas])
+
+
+FUNCOES_ETAPAS = {
+    'coletar': etapa_coletar,
+    'consolidar': etapa_consolidar,
+    'filtrar': etapa_filtrar,
+    'forma': etapa_forma,
+    'pontuar': etapa_pontuar,
+    'incerteza': etapa_incerteza,
+    'indexar': etapa_indexar,
+    'selecionar': etapa_selecionar,
+    'renderizar': etapa_renderizar,
+    'exportar': etapa_exportar,
+}
+
+
+def executar(config=None, ate: str = 'exportar', pular=(), estado=None, relatorio=None,
+             perfilar=None):
+    """Roda as etapas em ordem até `ate` (inclusive), exceto as de `pular`.
+
+    `estado` permite começar de dados já carregados (ex.: {'df': df} e pular 'coletar').
+    Com `relatorio` (RelatorioExecucao), cada etapa, coleta por liga, acesso ao banco e
+    gráfico é medido; `perfilar` grava um dump do cProfile da etapa indicada em
+    `perfil_<etapa>.prof` no diretório de saída. Retorna o estado final.
+    """
+    config = config or Configuracao()
+    estado = {} if estado is None else estado
+    relatorio = relatorio or RelatorioExecucao(memoria=False)
+    os.makedirs(config.diretorio_saida, exist_ok=True)
+    with relatorio.ativo():
+        for etapa in ETAPAS[:ETAPAS.index(ate) + 1]:
+            if etapa in pular:
+                continue
+            with medir('etapa', etapa) as registro:
+                profiler = cProfile.Profile() if etapa == perfilar else None
+                if profiler:
+                    profiler.enable()
+                FUNCOES_ETAPAS[etapa](estado, config)
+                if profiler:
+                    profiler.disable()
+                    profiler.dump_stats(os.path.join(config.diretorio_saida, f"perfil_{etapa}.prof"))
+                saida = estado.get(SAIDA_ETAPAS[etapa])
+                if saida is not None:
+                    registro['linhas'] = len(saida)
+    return estado
+
+
+def main(argv=None):
+    padrao = Configuracao()
+    parser = argparse.ArgumentParser(description="Análise de atacantes das 5 grandes ligas (Understat)")
+    parser.add_argument("--temporadas", nargs="+", type=int, default=padrao.temporadas)
+    parser.add_argument("--ligas", nargs="+", default=padrao.ligas)
+    parser.add_argument("--db", dest="db_url", default=padrao.db_url, help="string de conexão SQLAlchemy")
+    parser.add_argument("--offline", action="store_true", default=padrao.offline,
+                        help="usa apenas o cache local, sem banco nem API")
+    parser.add_argument("--saida", dest="diretorio_saida", default=padrao.diretorio_saida)
+    parser.add_argument("--formato", choices=['png', 'svg', 'none'], default=padrao.formato)
+    parser.add_argument("--dpi", type=int, default=padrao.dpi)
+    parser.add_argument("--processos", type=int, default=padrao.processos)
+    parser.add_argument("--n-jogadores", type=int, default=padrao.n_jogadores)
+    parser.add_argument("--max-por-liga", type=int, default=padrao.max_por_liga)
+    parser.add_argument("--sem-indice", dest="diretorio_indice", action="store_const", const=None,
+                        default=padrao.diretorio_indice, help="não atualiza o índice de similaridade")
+    parser.add_argument("--janela-forma", type=int, default=padrao.janela_forma, metavar="N",
+                        help="pondera a regularidade pelas últimas N partidas de cada atacante")
+    parser.add_argument("--exportar-formatos", dest="formatos_exportacao", nargs="*",
+                        choices=['parquet', 'csv', 'json'], default=padrao.formatos_exportacao,
+                        help="formatos da exportação particionada (sem valores: só o CSV da shortlist)")
+    parser.add_argument("--reamostras", type=int, default=padrao.reamostras,
+                        help="reamostras do bootstrap dos intervalos de score e posição (0 desliga)")
+    parser.add_argument("--ate", choices=ETAPAS, default='exportar', help="última etapa a executar")
+    parser.add_argument("--pular", nargs="+", choices=['incerteza', 'indexar', 'renderizar', 'exportar'], default=[])
+    parser.add_argument("--relatorio", default=None,
+                        help=f"caminho do relatório JSON de tempos (padrão: <saida>/{ARQUIVO_RELATORIO})")
+    parser.add_argument("--perfilar", choices=ETAPAS, default=None,
+                        help="grava um dump do cProfile da etapa escolhida")
+    parser.add_argument("--memoria", action="store_true",
+                        help="mede o pico de memória de cada etapa com tracemalloc (deixa a execução mais lenta)")
+    args = parser.parse_args(argv)
+
+    ate, pular, perfilar = args.ate, args.pular, args.perfilar
+    caminho_relatorio = args.relatorio or os.path.join(args.diretorio_saida, ARQUIVO_RELATORIO)
+    relatorio = RelatorioExecucao(memoria=args.memoria)
+    del args.ate, args.pular, args.perfilar, args.relatorio, args.memoria
+
+    estado = executar(Configuracao(**vars(args)), ate, pular, relatorio=relatorio, perfilar=perfilar)
+    relatorio.salvar(caminho_relatorio)
+    return estado
@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+
+# Pesos otimizados para atacantes (perfil padrão do README)
+PESOS_PADRAO = {
+    'Gols_90min': 0.45,              # Produção direta
+    'Impacto_Ofensivo': 0.25,        # Contribuição total
+    'Eficiencia_Finalizacao': 0.20,  # Qualidade técnica
+    'Key_Passes_90min': 0.10,        # Criação de jogo
+}
+
+FEATURES = list(PESOS_PADRAO)
+
+
+def calcular_features(df):
+    """Colunas derivadas usadas no score, sem alterar `df`."""
+    minutos_max = df['Minutos'].max()
+    return pd.DataFrame({
+        'Gols_90min': df['Gols_90min'],
+        'Impacto_Ofensivo': df['Gols_90min'] + (df['Assistências_90min'] * 0.8),
+        'Eficiencia_Finalizacao': df['Gols'] / df['xG'].replace(0, 0.1),
+        'Key_Passes_90min': df['Key_Passes_90min'],
+        'Fator_Regularidade': np.clip(np.sqrt(df['Minutos'] / minutos_max), 0.7, 1.0),
+    }, index=df.index)
+
+
+def matriz_pesos(perfis):
+    """Normaliza perfis para uma matriz (k, len(FEATURES)).
+
+    Aceita um dict de pesos, um dict {nome: pesos}, uma sequência de vetores ou um array.
+    Retorna (nomes, matriz).
+    """
+    if isinstance(perfis, dict) and set(perfis) <= set(FEATURES):
+        perfis = {'padrao': perfis}
+    if isinstance(perfis, dict):
+        nomes = list(perfis)
+        linhas = [[p[f] for f in FEATURES] if isinstance(p, dict) else p for p in perfis.values()]
+    else:
+        linhas = np.atleast_2d(np.asarray(perfis, dtype='float64'))
+        nomes = list(range(len(linhas)))
+    pesos = np.asarray(linhas, dtype='float64')
+    if pesos.ndim != 2 or pesos.shape[1] != len(FEATURES):
+        raise ValueError(f"Perfis de peso devem ter {len(FEATURES)} colunas ({', '.join(FEATURES)})")
+    return nomes, pesos
+
+
+# Scores por bloco em MotorScore.rankings (limita os temporários com muitos jogadores e perfis)
+MAX_ELEMENTOS_RANKING = 4_000_000
+
+
+class MotorScore:
+    """Matriz de features dos atacantes filtrados, montada uma única vez.
+
+    Qualquer quantidade de perfis de peso é pontuada com um único produto matricial:
+    scores = (X @ Wᵀ) * regularidade.
+
+    `regularidade` (Series alinhada a `df`) substitui o fator baseado nos minutos da
+    temporada onde não for nulo, ex.: a regularidade recente da janela de forma.
+    """
+
+    def __init__(self, df, regularidade=None):
+        features = calcular_features(df)
+        if regularidade is not None:
+            features['Fator_Regularidade'] = regularidade.fillna(features['Fator_Regularidade'])
+        self.index = df.index
+        self.features = features
+        self.X = features[FEATURES].to_numpy(dtype='float64')
+        self.regularidade = features['Fator_Regularidade'].to_numpy(dtype='float64')
+
+    def pontuar(self, perfis=PESOS_PADRAO):
+        """Scores (n_jogadores, n_perfis) como DataFrame indexado como o df original."""
+        nomes, pesos = matriz_pesos(perfis)
+        scores = (self.X @ pesos.T) * self.regularidade[:, None]
+        return pd.DataFrame(scores, index=self.index, columns=nomes)
+
+    def rankings(self, perfis=PESOS_PADRAO):
+        """Posição (1 = melhor, int32) de cada jogador em cada perfil; empates pela ordem do df.
+
+        Os perfis são pontuados e ordenados em blocos de até MAX_ELEMENTOS_RANKING scores,
+        então só a matriz de posições tem o tamanho jogadores x perfis.
+        """
+        nomes, pesos = matriz_pesos(perfis)
+        n = len(self.index)
+        posicoes = np.empty((n, len(nomes)), dtype='int32')
+        ranking = np.arange(1, n + 1, dtype='int32')[:, None]
+        bloco = max(1, MAX_ELEMENTOS_RANKING // max(1, n))
+        for inicio in range(0, len(nomes), bloco):
+            scores = (self.X @ pesos[inicio:inicio + bloco].T) * self.regularidade[:, None]
+            ordem = np.argsort(-scores, axis=0, kind='stable')
+            np.put_along_axis(posicoes[:, inicio:inicio + bloco], ordem, ranking, axis=0)
+        return pd.DataFrame(posicoes, index=self.index, columns=nomes)
+
+
+def colunas_score(df, pesos=PESOS_PADRAO, motor=None, regularidade=None):
+    motor = motor or MotorScore(df, regularidade)
+    score_base = motor.X @ matriz_pesos(pesos)[1][0]
+    return {
+        'Eficiencia_Finalizacao': motor.features['Eficiencia_Finalizacao'],
+        'Fator_Regularidade': motor.features['Fator_Regularidade'],
+        'Impacto_Ofensivo': motor.features['Impacto_Ofensivo'],
+        'Score_Base': score_base,
+        'Score_Ponderado': score_base * motor.regularidade,
+    }
+
+
+# Faixas de jogos na temporada de cada nível de risco
+BINS_RISCO = [0, 20, 28, 35, 50]
+NIVEIS_RISCO = ['Alto', 'Médio', 'Baixo', 'Muito Baixo']
+
+
+def colunas_perfil(df, bins_risco=BINS_RISCO):
+    return {
+        'Versatilidade': (df['Gols_90min'] > 0.3) & (df['Assistências_90min'] > 0.1),
+        'Nivel_Risco': pd.cut(df['Jogos'], bins=bins_risco, labels=NIVEIS_RISCO),
+    }
+
+
+valor_liga = {
+    'epl': 1.0,        # Premier League (referência estimada - mais caro)
+    'La_Liga': 0.95,   # La Liga (estimativa - próxima em valor)
+    'Bundesliga': 0.90, # Bundesliga (estimativa - liga competitiva)
+    'Serie_A': 0.85,   # Serie A (estimativa - menor valorização)
+    'Ligue_1': 0.80    # Ligue 1 (estimativa - oportunidades de valor)
+}
+
+
+def colunas_custo_beneficio(df, score_ponderado, fatores_liga=valor_liga):
+    fator_liga = df['Liga'].map(fatores_liga).astype('float64').fillna(0.85)
+    return {'Fator_Liga': fator_liga, 'Custo_Beneficio': score_ponderado / fator_liga}
+
+
+def calcular_score_ponderado(df, pesos=PESOS_PADRAO):
+    return df.assign(**colunas_score(df, pesos))
+
+
+def classificar_perfil(df, bins_risco=BINS_RISCO):
+    return df.assign(**colunas_perfil(df, bins_risco))
+
+
+def analisar_custo_beneficio_balanceado(df, fatores_liga=valor_liga):
+    return df.assign(**colunas_custo_beneficio(df, df['Score_Ponderado'], fatores_liga))
+
+
+def pontuar_atacantes(df, pesos=PESOS_PADRAO, regularidade=None, fatores_liga=valor_liga,
+                      bins_risco=BINS_RISCO):
+    """Score, perfil e custo-benefício numa única atribuição de colunas sobre `df`.
+
+    Equivale a encadear calcular_score_ponderado, classificar_perfil e
+    analisar_custo_beneficio_balanceado, mas sem materializar as cópias intermediárias.
+    """
+    score = colunas_score(df, pesos, regularidade=regularidade)
+    return df.assign(**score, **colunas_perfil(df, bins_risco),
+                     **colunas_custo_beneficio(df, score['Score_Ponderado'], fatores_liga))
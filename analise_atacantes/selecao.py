@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+
+def top_k_indices(valores, k: int):
+    """Posições dos k maiores valores, em ordem decrescente, sem ordenar o vetor inteiro.
+
+    Usa seleção parcial (np.partition) para achar o k-ésimo valor e só ordena os
+    escolhidos. Empates são resolvidos pela posição (a primeira ganha); NaN fica por último.
+    """
+    valores = np.asarray(valores, dtype='float64')
+    valores = np.where(np.isnan(valores), -np.inf, valores)
+    n = len(valores)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype='int64')
+
+    limite = -np.partition(-valores, k - 1)[k - 1]
+    maiores = np.flatnonzero(valores > limite)
+    empates = np.flatnonzero(valores == limite)[:k - len(maiores)]
+    escolhidos = np.concatenate([maiores, empates])
+    return escolhidos[np.lexsort((escolhidos, -valores[escolhidos]))]
+
+
+def top_k(df, coluna: str, k: int):
+    return df.iloc[top_k_indices(df[coluna].to_numpy(), k)]
+
+
+def _posicoes_por_grupo(df, valores, k: int, por):
+    posicoes = [idx[top_k_indices(valores[idx], k)]
+                for idx in df.groupby(por, sort=False, observed=True).indices.values()]
+    return np.concatenate(posicoes) if posicoes else np.empty(0, dtype='int64')
+
+
+def top_k_por_grupo(df, coluna: str, k: int, por):
+    """Top-k de `coluna` dentro de cada grupo (ex.: por liga ou por temporada)."""
+    return df.iloc[_posicoes_por_grupo(df, df[coluna].to_numpy(), k, por)]
+
+
+def top_k_com_cota(df, coluna: str, k: int, por='Liga', max_por_grupo: int = 3):
+    """Top-k global com no máximo `max_por_grupo` jogadores de cada grupo.
+
+    Só os `max_por_grupo` melhores de cada grupo podem entrar na seleção, então basta
+    um top-k sobre esse conjunto reduzido.
+    """
+    valores = df[coluna].to_numpy()
+    # Candidatos na ordem original, para o desempate continuar determinístico
+    candidatos = np.sort(_posicoes_por_grupo(df, valores, min(k, max_por_grupo), por))
+    return df.iloc[candidatos[top_k_indices(valores[candidatos], k)]]
+
+
+def top_k_por_perfil(scores, k: int):
+    """Para uma matriz de scores (jogadores x perfis), índices do top-k de cada perfil."""
+    return pd.DataFrame({perfil: scores.index[top_k_indices(scores[perfil].to_numpy(), k)]
+                         for perfil in scores.columns})
+
+
+def criar_shortlist_final(df_fwd, n_jogadores: int = 10, max_por_liga=None):
+    if max_por_liga is None:
+        return top_k(df_fwd, 'Score_Ponderado', n_jogadores)
+    return top_k_com_cota(df_fwd, 'Score_Ponderado', n_jogadores, 'Liga', max_por_liga)
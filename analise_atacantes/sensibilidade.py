@@ -0,0 +1,209 @@
+"""Varredura de sensibilidade da shortlist aos parâmetros fixos da análise.
+
+Avalia uma grade de limites de filtro (jogos, minutos, gols/90), exclusão de clubes
+grandes, fatores de valor por liga e faixas de Nivel_Risco, e reporta como a shortlist e
+o Custo_Beneficio médio por liga mudam em relação à configuração padrão.
+
+    python -m analise_atacantes.sensibilidade --offline --processos 8 --saida sensibilidade.csv
+"""
+import argparse
+import itertools
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from analise_atacantes.filtros import aplicar_filtros_realistas, clubes_grandes
+from analise_atacantes.score import (BINS_RISCO, colunas_custo_beneficio, colunas_perfil, pontuar_atacantes,
+                                     valor_liga)
+from analise_atacantes.selecao import criar_shortlist_final
+
+FATORES_LIGA = {
+    'padrao': valor_liga,
+    'uniforme': {liga: 1.0 for liga in valor_liga},
+    # Diferença entre as ligas dobrada em torno de 0.9
+    'amplo': {liga: round(0.9 + 2 * (fator - 0.9), 2) for liga, fator in valor_liga.items()},
+}
+FAIXAS_RISCO = {
+    'padrao': BINS_RISCO,
+    'rigido': [0, 25, 32, 36, 50],
+    'flexivel': [0, 15, 24, 30, 50],
+}
+GRADE_PADRAO = {
+    'min_jogos': [10, 12, 15, 18, 20],
+    'min_minutos': [600, 750, 900, 1200, 1500],
+    'min_gols_90': [0.1, 0.15, 0.2, 0.25, 0.3],
+    'excluir_clubes': [True, False],
+    'fatores_liga': list(FATORES_LIGA),
+    'faixas_risco': list(FAIXAS_RISCO),
+}
+FILTROS = ['min_jogos', 'min_minutos', 'min_gols_90', 'excluir_clubes']
+CONFIGURACAO_PADRAO = {'min_jogos': 15, 'min_minutos': 900, 'min_gols_90': 0.2, 'excluir_clubes': True,
+                       'fatores_liga': 'padrao', 'faixas_risco': 'padrao'}
+
+# Estado de cada worker, preenchido por _inicializar
+_DADOS = {}
+
+
+def gravar_compartilhado(df, diretorio: str):
+    """Grava `df` como um .npy por coluna (texto/categoria como códigos + categorias no JSON).
+
+    Os workers abrem os arquivos com memory-map, então as páginas são compartilhadas
+    pelo cache do sistema em vez de o DataFrame ser serializado para cada tarefa.
+    """
+    esquema = {'colunas': [], 'categorias': {}}
+    for i, coluna in enumerate(df.columns):
+        serie = df[coluna]
+        if not (pd.api.types.is_numeric_dtype(serie) or pd.api.types.is_bool_dtype(serie)):
+            serie = serie.astype(str).astype('category')
+            esquema['categorias'][coluna] = serie.cat.categories.tolist()
+            serie = serie.cat.codes
+        np.save(os.path.join(diretorio, f"{i}.npy"), serie.to_numpy())
+        esquema['colunas'].append(coluna)
+    with open(os.path.join(diretorio, 'esquema.json'), "w", encoding="utf-8") as f:
+        json.dump(esquema, f, ensure_ascii=False)
+
+
+def abrir_compartilhado(diretorio: str):
+    with open(os.path.join(diretorio, 'esquema.json'), encoding="utf-8") as f:
+        esquema = json.load(f)
+    colunas = {}
+    for i, coluna in enumerate(esquema['colunas']):
+        valores = np.load(os.path.join(diretorio, f"{i}.npy"), mmap_mode='r')
+        if coluna in esquema['categorias']:
+            valores = pd.Categorical.from_codes(valores, esquema['categorias'][coluna])
+        colunas[coluna] = valores
+    return pd.DataFrame(colunas, copy=False)
+
+
+def _membros(shortlist):
+    """(Id, Temporada) de cada jogador da shortlist, em ordem: o mesmo Id se repete entre temporadas."""
+    return list(zip(shortlist['Id'].astype('int64').tolist(), shortlist['Temporada'].astype('int64').tolist()))
+
+
+def _inicializar(diretorio, shortlist_base, n_jogadores, fatores_liga, faixas_risco):
+    _DADOS['df'] = abrir_compartilhado(diretorio)
+    _DADOS['shortlist_base'] = frozenset(shortlist_base)
+    _DADOS['n_jogadores'] = n_jogadores
+    _DADOS['fatores_liga'] = fatores_liga
+    _DADOS['faixas_risco'] = faixas_risco
+
+
+def _avaliar(filtro):
+    """Linhas de resultado de uma combinação de filtros com cada fator de liga e faixa de risco.
+
+    Só os filtros mudam o pool, o Score_Ponderado e portanto a shortlist; fatores de liga
+    e faixas de risco são aplicados depois sobre o mesmo resultado, sem refiltrar.
+    """
+    df_fwd = aplicar_filtros_realistas(_DADOS['df'], clubes_grandes if filtro['excluir_clubes'] else (),
+                                       filtro['min_jogos'], filtro['min_minutos'], filtro['min_gols_90'])
+    df_fwd = pontuar_atacantes(df_fwd)
+    shortlist = criar_shortlist_final(df_fwd, _DADOS['n_jogadores'])
+
+    membros = _membros(shortlist)
+    ids = frozenset(membros)
+    base = _DADOS['shortlist_base']
+    comum = {
+        'Atacantes': len(df_fwd),
+        'Shortlist': ' '.join(f"{i}:{t}" for i, t in membros),
+        'Mesma_Shortlist': ids == base,
+        'Jaccard': len(ids & base) / len(ids | base) if ids | base else 1.0,
+    }
+    # O fator é constante dentro da liga: a média do Custo_Beneficio é a média do score dividida por ele
+    score_por_liga = df_fwd['Score_Ponderado'].groupby(df_fwd['Liga'], observed=True).mean()
+    ligas = score_por_liga.index.to_series()
+    riscos = {faixas: int((colunas_perfil(shortlist, FAIXAS_RISCO[faixas])['Nivel_Risco'] == 'Alto').sum())
+              for faixas in _DADOS['faixas_risco']}
+
+    resultados = []
+    for fatores in _DADOS['fatores_liga']:
+        por_liga = score_por_liga / colunas_custo_beneficio(ligas.to_frame('Liga'), 1.0,
+                                                            FATORES_LIGA[fatores])['Fator_Liga']
+        for faixas, risco_alto in riscos.items():
+            resultados.append({**filtro, 'fatores_liga': fatores, 'faixas_risco': faixas, **comum,
+                               'Risco_Alto_Shortlist': risco_alto,
+                               **{f"CB_{liga}": valor for liga, valor in por_liga.items()}})
+    return resultados
+
+
+def expandir_grade(grade=GRADE_PADRAO):
+    """Combinações dos parâmetros de filtro da grade (fatores de liga e faixas de risco à parte)."""
+    nomes = [p for p in grade if p in FILTROS]
+    return [dict(zip(nomes, valores)) for valores in itertools.product(*(grade[p] for p in nomes))]
+
+
+def varrer(df, grade=GRADE_PADRAO, n_jogadores: int = 10, processos: int = None):
+    """Avalia cada combinação da grade sobre `df` (consolidado, antes do filtro).
+
+    Retorna um DataFrame com uma linha por configuração: parâmetros, tamanho do pool de
+    atacantes, shortlist ("Id:Temporada" em ordem), se ela é igual à da configuração padrão, índice
+    de Jaccard contra ela, quantos da shortlist têm risco Alto e o Custo_Beneficio médio
+    de cada liga. As tarefas são as combinações de filtros; cada worker abre os dados via
+    memory-map uma única vez.
+    """
+    grade = {**{p: [v] for p, v in CONFIGURACAO_PADRAO.items()}, **grade}
+    filtros = expandir_grade(grade)
+    padrao = {p: v for p, v in CONFIGURACAO_PADRAO.items() if p in FILTROS}
+    # Todo filtro exige posição de atacante: o resto nunca entra em nenhuma configuração
+    df = df[df['Posição'].str.contains('F', na=False)]
+    with tempfile.TemporaryDirectory(prefix='sensibilidade_') as diretorio:
+        gravar_compartilhado(df, diretorio)
+        _inicializar(diretorio, (), n_jogadores, ['padrao'], ['padrao'])
+        base = [tuple(int(v) for v in membro.split(':')) for membro in _avaliar(padrao)[0]['Shortlist'].split()]
+        argumentos = (diretorio, base, n_jogadores, grade['fatores_liga'], grade['faixas_risco'])
+
+        processos = processos or os.cpu_count()
+        if processos > 1:
+            lote = max(1, len(filtros) // (processos * 8))
+            with ProcessPoolExecutor(processos, initializer=_inicializar, initargs=argumentos) as executor:
+                resultados = list(executor.map(_avaliar, filtros, chunksize=lote))
+        else:
+            _inicializar(*argumentos)
+            resultados = [_avaliar(f) for f in filtros]
+        _DADOS.clear()
+    return pd.DataFrame(itertools.chain.from_iterable(resultados))
+
+
+def resumir(resultados, n: int = 15):
+    """Frequência de cada (Id, Temporada) nas shortlists da varredura."""
+    membros = resultados['Shortlist'].str.split().explode().dropna().str.split(':', expand=True).astype('int64')
+    membros.columns = ['Id', 'Temporada']
+    return (membros.value_counts() / len(resultados)).rename('Frequencia').head(n)
+
+
+def main(argv=None):
+    from analise_atacantes.pipeline import Configuracao, executar
+
+    padrao = Configuracao()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--temporadas", nargs="+", type=int, default=padrao.temporadas)
+    parser.add_argument("--ligas", nargs="+", default=padrao.ligas)
+    parser.add_argument("--db", dest="db_url", default=padrao.db_url)
+    parser.add_argument("--offline", action="store_true", default=padrao.offline)
+    parser.add_argument("--processos", type=int, default=None)
+    parser.add_argument("--n-jogadores", type=int, default=padrao.n_jogadores)
+    parser.add_argument("--saida", default="sensibilidade.csv")
+    args = parser.parse_args(argv)
+
+    config = Configuracao(ligas=args.ligas, temporadas=args.temporadas, db_url=args.db_url, offline=args.offline)
+    df = executar(config, ate='consolidar')['df']
+    resultados = varrer(df, n_jogadores=args.n_jogadores, processos=args.processos)
+    resultados.to_csv(args.saida, index=False)
+
+    print(f"{len(resultados)} configurações avaliadas -> {args.saida}")
+    print(f"Shortlist igual à padrão em {resultados['Mesma_Shortlist'].mean():.1%} das configurações "
+          f"(Jaccard médio {resultados['Jaccard'].mean():.2f})")
+    for parametro in FILTROS:
+        print(resultados.groupby(parametro)['Jaccard'].mean().round(2).to_string(), end="\n\n")
+    colunas_cb = [c for c in resultados if c.startswith('CB_')]
+    print(resultados.groupby('fatores_liga')[colunas_cb].mean().round(3).to_string(), end="\n\n")
+    print(resultados.groupby('faixas_risco')['Risco_Alto_Shortlist'].mean().round(2).to_string(), end="\n\n")
+    print("Jogadores mais presentes nas shortlists:")
+    print(resumir(resultados).to_string())
+
+
+if __name__ == "__main__":
+    main()
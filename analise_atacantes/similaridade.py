@@ -0,0 +1,219 @@
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.feather as feather
+
+from analise_atacantes.cache_local import DIRETORIO_CACHE
+from analise_atacantes.selecao import top_k_indices
+
+DIRETORIO_INDICE = os.path.join(DIRETORIO_CACHE, 'indice')
+
+# Produção por 90min e features do score usadas para comparar atacantes
+FEATURES_SIMILARIDADE = [
+    'Gols_90min', 'Assistências_90min', 'xG_90min', 'xA_90min', 'Shots_90min',
+    'Key_Passes_90min', 'Eficiencia_Finalizacao', 'Impacto_Ofensivo',
+]
+METRICAS_PERCENTIL = FEATURES_SIMILARIDADE + ['Score_Ponderado', 'Custo_Beneficio']
+COLUNAS_META = ['Id', 'Nome', 'Time', 'Liga', 'Temporada']
+
+
+def _chave(liga, temporada):
+    return f"{liga}|{temporada}"
+
+
+def _hash_particao(df):
+    return str(int(pd.util.hash_pandas_object(df[COLUNAS_META + METRICAS_PERCENTIL], index=False)
+                   .sum()))
+
+
+def _percentis(df):
+    """Percentil (0-1) de cada métrica dentro da liga/temporada e dentro da temporada."""
+    metricas = df[METRICAS_PERCENTIL]
+    por_liga = metricas.groupby([df['Liga'], df['Temporada']], observed=True).rank(pct=True)
+    por_temporada = metricas.groupby(df['Temporada']).rank(pct=True)
+    return pd.concat([por_liga.add_suffix('_pct_liga'), por_temporada.add_suffix('_pct_temporada')],
+                     axis=1).astype('float32')
+
+
+class IndiceAtacantes:
+    """Vetores normalizados (z-score) dos atacantes pontuados + tabelas de percentis.
+
+    As consultas de similaridade são kNN exato por distância euclidiana sobre a matriz
+    float32 pré-computada (um produto matriz-vetor + seleção parcial), e as de percentil
+    filtram colunas já calculadas, sem reprocessar o DataFrame. O índice é particionado
+    por (liga, temporada): `atualizar` só substitui as partições novas ou alteradas.
+    Os valores das métricas ficam guardados para recalcular o percentil na temporada
+    inteira quando só parte dela muda.
+    """
+
+    def __init__(self, meta, vetores, valores, percentis, media, desvio, hashes):
+        self.meta = meta.reset_index(drop=True)
+        self.vetores = vetores
+        self.valores = valores.reset_index(drop=True)
+        self.percentis = percentis.reset_index(drop=True)
+        self.media = media
+        self.desvio = desvio
+        self.hashes = hashes
+        self._normas = np.einsum('ij,ij->i', vetores, vetores)
+
+    @classmethod
+    def construir(cls, df_fwd):
+        features = df_fwd[FEATURES_SIMILARIDADE].to_numpy(dtype='float64')
+        media = features.mean(axis=0)
+        desvio = features.std(axis=0)
+        desvio[desvio == 0] = 1.0
+        hashes = {_chave(liga, temporada): _hash_particao(g)
+                  for (liga, temporada), g in df_fwd.groupby(['Liga', 'Temporada'], observed=True)}
+        return cls(cls._meta(df_fwd), cls._vetorizar(features, media, desvio), cls._valores(df_fwd),
+                   _percentis(df_fwd), media, desvio, hashes)
+
+    @staticmethod
+    def _meta(df):
+        meta = df[COLUNAS_META].reset_index(drop=True)
+        return meta.astype({c: str for c in ['Nome', 'Time', 'Liga']})
+
+    @staticmethod
+    def _valores(df):
+        return df[METRICAS_PERCENTIL].reset_index(drop=True).astype('float64')
+
+    @staticmethod
+    def _vetorizar(features, media, desvio):
+        return ((features - media) / desvio).astype('float32')
+
+    def atualizar(self, df_fwd):
+        """Substitui as partições (liga, temporada) de `df_fwd` cujo conteúdo mudou; retorna as atualizadas.
+
+        As demais partições, inclusive outras ligas da mesma temporada, ficam como estão.
+        O percentil na liga vem da própria partição; o da temporada é recalculado sobre a
+        temporada inteira do índice. A normalização mantém a média/desvio da construção,
+        para os vetores antigos continuarem comparáveis.
+        """
+        alteradas = {}
+        for (liga, temporada), grupo in df_fwd.groupby(['Liga', 'Temporada'], observed=True):
+            if self.hashes.get(_chave(liga, temporada)) != _hash_particao(grupo):
+                alteradas[_chave(liga, temporada)] = grupo
+        if not alteradas:
+            return []
+
+        chaves = self.meta['Liga'].astype(str) + '|' + self.meta['Temporada'].astype(str)
+        manter = ~chaves.isin(alteradas).to_numpy()
+        novos = pd.concat(alteradas.values())
+        features = novos[FEATURES_SIMILARIDADE].to_numpy(dtype='float64')
+        self.meta = pd.concat([self.meta[manter], self._meta(novos)], ignore_index=True)
+        self.valores = pd.concat([self.valores[manter], self._valores(novos)], ignore_index=True)
+        self.vetores = np.concatenate([self.vetores[manter], self._vetorizar(features, self.media, self.desvio)])
+        self._normas = np.einsum('ij,ij->i', self.vetores, self.vetores)
+
+        percentis = self.percentis[manter].reset_index(drop=True).reindex(pd.RangeIndex(len(self.meta)))
+        temporadas = self.meta['Temporada'].isin(novos['Temporada'].unique()).to_numpy()
+        recalculados = _percentis(pd.concat([self.meta, self.valores], axis=1)[temporadas])
+        percentis.loc[recalculados.index] = recalculados
+        self.percentis = percentis.astype('float32')
+        for chave, grupo in alteradas.items():
+            self.hashes[chave] = _hash_particao(grupo)
+        return sorted(alteradas)
+
+    def similares(self, id_jogador: int, temporada: int = None, n: int = 10, mesma_temporada: bool = False):
+        """Os `n` atacantes mais próximos do jogador em produção por 90min."""
+        linhas = np.flatnonzero(self.meta['Id'].to_numpy() == id_jogador)
+        if temporada is not None:
+            linhas = linhas[self.meta['Temporada'].to_numpy()[linhas] == temporada]
+        if len(linhas) == 0:
+            em = f" na temporada {temporada}" if temporada is not None else ""
+            raise KeyError(f"Jogador {id_jogador} não está no índice{em}")
+        alvo = linhas[np.argmax(self.meta['Temporada'].to_numpy()[linhas])]
+
+        consulta = self.vetores[alvo]
+        distancias = self._normas - 2 * (self.vetores @ consulta) + self._normas[alvo]
+        distancias[self.meta['Id'].to_numpy() == id_jogador] = np.inf
+        if mesma_temporada:
+            distancias[self.meta['Temporada'].to_numpy() != self.meta['Temporada'].iat[alvo]] = np.inf
+        escolhidos = top_k_indices(-distancias, n)
+        escolhidos = escolhidos[np.isfinite(distancias[escolhidos])]
+        resultado = self.meta.iloc[escolhidos].copy()
+        resultado['Distancia'] = np.sqrt(np.maximum(distancias[escolhidos], 0))
+        return resultado
+
+    def acima_do_percentil(self, metrica: str, percentil: float = 0.9, liga: str = None,
+                           temporada: int = None):
+        """Atacantes com `metrica` no percentil >= `percentil` da liga (se `liga`) ou da temporada."""
+        coluna = f"{metrica}_pct_liga" if liga is not None else f"{metrica}_pct_temporada"
+        if coluna not in self.percentis:
+            raise KeyError(f"Métrica sem percentil no índice: {metrica}")
+        mascara = self.percentis[coluna].to_numpy() >= percentil
+        if liga is not None:
+            mascara &= self.meta['Liga'].to_numpy() == liga
+        if temporada is not None:
+            mascara &= self.meta['Temporada'].to_numpy() == temporada
+        resultado = self.meta[mascara].assign(Percentil=self.percentis.loc[mascara, coluna])
+        return resultado.sort_values('Percentil', ascending=False, kind='stable')
+
+    def salvar(self, diretorio: str = DIRETORIO_INDICE):
+        os.makedirs(diretorio, exist_ok=True)
+        feather.write_feather(pd.concat([self.meta, self.valores, self.percentis], axis=1),
+                              os.path.join(diretorio, 'atacantes.feather'), compression='uncompressed')
+        np.save(os.path.join(diretorio, 'vetores.npy'), self.vetores)
+        with open(os.path.join(diretorio, 'indice.json'), "w", encoding="utf-8") as f:
+            json.dump({'features': FEATURES_SIMILARIDADE, 'media': self.media.tolist(),
+                       'desvio': self.desvio.tolist(), 'hashes': self.hashes}, f, indent=2)
+
+    @classmethod
+    def carregar(cls, diretorio: str = DIRETORIO_INDICE):
+        with open(os.path.join(diretorio, 'indice.json'), encoding="utf-8") as f:
+            info = json.load(f)
+        if info['features'] != FEATURES_SIMILARIDADE:
+            raise ValueError("Índice gravado com outras features; reconstrua-o")
+        tabela = feather.read_table(os.path.join(diretorio, 'atacantes.feather'), memory_map=True).to_pandas()
+        if not set(METRICAS_PERCENTIL) <= set(tabela.columns):
+            raise ValueError("Índice gravado sem os valores das métricas; reconstrua-o")
+        vetores = np.load(os.path.join(diretorio, 'vetores.npy'), mmap_mode='r')
+        return cls(tabela[COLUNAS_META], np.asarray(vetores), tabela[METRICAS_PERCENTIL],
+                   tabela.drop(columns=COLUNAS_META + METRICAS_PERCENTIL),
+                   np.array(info['media']), np.array(info['desvio']), info['hashes'])
+
+
+def atualizar_indice(df_fwd, diretorio: str = DIRETORIO_INDICE):
+    """Carrega o índice persistido e o atualiza com `df_fwd`, ou o constrói se não existir."""
+    try:
+        indice = IndiceAtacantes.carregar(diretorio)
+    except (FileNotFoundError, ValueError):
+        indice = IndiceAtacantes.construir(df_fwd)
+        print(f"Índice de similaridade construído ({len(indice.meta)} atacantes)")
+    else:
+        particoes = indice.atualizar(df_fwd)
+        if not particoes:
+            return indice
+        print(f"Índice de similaridade atualizado: partições {', '.join(particoes)}")
+    indice.salvar(diretorio)
+    return indice
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Consultas ao índice de similaridade/percentis de atacantes")
+    parser.add_argument("--indice", default=DIRETORIO_INDICE)
+    parser.add_argument("--temporada", type=int, default=None)
+    parser.add_argument("-n", type=int, default=10)
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument("--similares", type=int, metavar="ID", help="atacantes parecidos com o jogador")
+    grupo.add_argument("--percentil", nargs=2, metavar=("METRICA", "P"),
+                       help="atacantes com METRICA no percentil >= P (0-1)")
+    parser.add_argument("--liga", default=None)
+    args = parser.parse_args(argv)
+
+    indice = IndiceAtacantes.carregar(args.indice)
+    try:
+        if args.similares is not None:
+            resultado = indice.similares(args.similares, args.temporada, args.n)
+        else:
+            metrica, percentil = args.percentil
+            resultado = indice.acima_do_percentil(metrica, float(percentil), args.liga, args.temporada)
+    except KeyError as e:
+        parser.exit(1, f"{parser.prog}: {e.args[0]}\n")
+    print(resultado.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import numpy as np
+
+from analise_atacantes.coleta import LIGAS
+
+# ~2.8k jogadores nas 5 ligas, como numa temporada real do Understat
+JOGADORES_POR_LIGA = 560
+TIMES_POR_LIGA = 20
+
+POSICOES = ['F S', 'F', 'F M S', 'M S', 'M', 'D', 'D M', 'GK', 'S']
+PROB_POSICOES = [0.14, 0.05, 0.06, 0.12, 0.18, 0.22, 0.08, 0.07, 0.08]
+# xG por 90min médio de cada posição
+XG_90_POSICOES = [0.40, 0.35, 0.30, 0.15, 0.08, 0.04, 0.06, 0.0, 0.02]
+
+
+def gerar_temporada(rng, temporada: int, ligas=LIGAS, jogadores_por_liga: int = JOGADORES_POR_LIGA,
+                    taxa_transferencias: float = 0.03):
+    """Payloads sintéticos {(liga, temporada): [jogador, ...]} no formato de `get_league_players`.
+
+    Uma fração `taxa_transferencias` dos jogadores aparece também em outra liga com o
+    mesmo id e os minutos divididos, como nas transferências de meio de temporada.
+    """
+    n = len(ligas) * jogadores_por_liga
+    ids = np.arange(n)
+    liga_idx = np.repeat(np.arange(len(ligas)), jogadores_por_liga)
+    time_idx = rng.integers(0, TIMES_POR_LIGA, n)
+    posicao_idx = rng.choice(len(POSICOES), n, p=PROB_POSICOES)
+    minutos = np.minimum(rng.gamma(1.6, 900, n), 3420).astype(int)
+    jogos = np.clip(np.ceil(minutos / rng.uniform(55, 90, n)), 0, 38).astype(int)
+
+    xg_90 = np.array(XG_90_POSICOES)[posicao_idx] * rng.lognormal(0, 0.5, n)
+    xg = xg_90 * minutos / 90
+    xa = rng.gamma(1.2, 0.08, n) * minutos / 90
+    gols = rng.poisson(xg)
+    assistencias = rng.poisson(xa)
+    finalizacoes = rng.poisson(xg * 7 + minutos / 900)
+    passes_chave = rng.poisson(xa * 9 + minutos / 300)
+
+    transferidos = rng.random(n) < taxa_transferencias
+    nova_liga = (liga_idx + rng.integers(1, len(ligas), n)) % len(ligas)
+    fracao = rng.uniform(0.2, 0.8, n)
+
+    # Uma linha por (jogador, liga): os transferidos têm a parte `fracao` na liga de origem
+    # e o restante na nova. Montado por colunas, sem laço Python por jogador.
+    linha = np.concatenate([ids, ids[transferidos]])
+    liga_linha = np.concatenate([liga_idx, nova_liga[transferidos]])
+    escala = np.concatenate([np.where(transferidos, fracao, 1.0), 1 - fracao[transferidos]])
+    ordem = np.lexsort((linha, liga_linha))
+    linha, liga_linha, escala = linha[ordem], liga_linha[ordem], escala[ordem]
+
+    def inteiros(valores):
+        return valores.astype(int).astype(str)
+
+    def arredondados(valores):
+        return inteiros(np.round(valores[linha] * escala))
+
+    def decimais(valores):
+        return np.char.mod('%.12f', valores)
+
+    nomes_ligas = np.array(ligas, dtype=object)
+    id_texto = inteiros(ids[linha])
+    jogos_linha = jogos[linha]
+    gols_linha = arredondados(gols)
+    xg_linha = decimais(xg[linha] * escala)
+    colunas = {
+        'id': id_texto,
+        'player_name': np.char.add("Jogador ", id_texto),
+        'team_title': nomes_ligas[liga_linha] + " Time " + inteiros(time_idx[linha]).astype(object),
+        'position': np.array(POSICOES)[posicao_idx[linha]],
+        'games': inteiros(np.where(jogos_linha > 0, np.maximum(1, (jogos_linha * escala).astype(int)), 0)),
+        'time': inteiros(minutos[linha] * escala),
+        'goals': gols_linha,
+        'assists': arredondados(assistencias),
+        'shots': arredondados(finalizacoes),
+        'key_passes': arredondados(passes_chave),
+        'xG': xg_linha,
+        'xA': decimais(xa[linha] * escala),
+        'yellow_cards': np.full(len(linha), '0'),
+        'red_cards': np.full(len(linha), '0'),
+        'npg': gols_linha,
+        'npxG': xg_linha,
+        'xGChain': decimais((xg[linha] + xa[linha]) * escala),
+        'xGBuildup': decimais(xa[linha] * escala / 2),
+    }
+    valores = list(zip(*(c.tolist() for c in colunas.values())))
+
+    payloads = {}
+    limites = np.searchsorted(liga_linha, np.arange(len(ligas) + 1))
+    for k, liga in enumerate(ligas):
+        payloads[(liga, temporada)] = [dict(zip(colunas, v)) for v in valores[limites[k]:limites[k + 1]]]
+    return payloads
+
+
+def gerar_temporadas(escala: int = 1, semente: int = 42, temporada_final: int = 2024, **kwargs):
+    """Gerador com os payloads de uma temporada por vez, da mais recente para trás.
+
+    Mesmos dados de `gerar_payloads`, mas só uma temporada fica em memória: use nas
+    escalas grandes (1000 temporadas em dicts de jogador passariam de vários GB).
+    """
+    rng = np.random.default_rng(semente)
+    for k in range(escala):
+        yield gerar_temporada(rng, temporada_final - k, **kwargs)
+
+
+def gerar_payloads(escala: int = 1, semente: int = 42, temporada_final: int = 2024, **kwargs):
+    """`escala` temporadas completas (escala 1 ≈ 2.8k jogadores), reprodutíveis pela semente.
+
+    Os ids se repetem entre temporadas, como o mesmo jogador em anos diferentes.
+    """
+    payloads = {}
+    for temporada in gerar_temporadas(escala, semente, temporada_final, **kwargs):
+        payloads.update(temporada)
+    return payloads
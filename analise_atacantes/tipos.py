@@ -0,0 +1,71 @@
+import argparse
+
+import pandas as pd
+
+# Esquema compacto da tabela de jogadores: textos repetidos viram categorias,
+# contagens usam inteiros pequenos e taxas float32
+SCHEMA_COMPACTO = {
+    'Id': 'int32',
+    'Nome': 'category',
+    'Time': 'category',
+    'Posição': 'category',
+    'Gols': 'int16',
+    'Assistências': 'int16',
+    'xG': 'float32',
+    'xA': 'float32',
+    'Finalizações': 'int16',
+    'Passes-chave': 'int16',
+    'Minutos': 'int32',
+    'Jogos': 'int16',
+    'Gols_90min': 'float32',
+    'Assistências_90min': 'float32',
+    'xG_90min': 'float32',
+    'xA_90min': 'float32',
+    'Shots_90min': 'float32',
+    'Key_Passes_90min': 'float32',
+    'Liga': 'category',
+    'Temporada': 'int16',
+}
+
+
+def compactar(df):
+    """Converte as colunas conhecidas para o SCHEMA_COMPACTO; as demais ficam como estão."""
+    tipos = {coluna: dtype for coluna, dtype in SCHEMA_COMPACTO.items()
+             if coluna in df.columns and str(df[coluna].dtype) != dtype}
+    return df.astype(tipos) if tipos else df
+
+
+def relatorio_memoria(original, compacto=None):
+    """Bytes por coluna antes/depois da compactação, com linha de total."""
+    compacto = compactar(original) if compacto is None else compacto
+    relatorio = pd.DataFrame({
+        'dtype_original': original.dtypes.astype(str),
+        'bytes_original': original.memory_usage(deep=True, index=False),
+        'dtype_compacto': compacto.dtypes.astype(str),
+        'bytes_compacto': compacto.memory_usage(deep=True, index=False),
+    })
+    relatorio.loc['TOTAL'] = ['', relatorio['bytes_original'].sum(), '', relatorio['bytes_compacto'].sum()]
+    relatorio['reducao_%'] = (1 - relatorio['bytes_compacto'] / relatorio['bytes_original']) * 100
+    return relatorio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara o consumo de memória da tabela de jogadores "
+                                                 "no esquema original e no compacto (dados sintéticos)")
+    parser.add_argument("--escala", type=int, default=10, help="temporadas sintéticas (1 ≈ 2.8k jogadores)")
+    args = parser.parse_args(argv)
+
+    from analise_atacantes.metricas import parse_jogadores
+    from analise_atacantes.sintetico import gerar_temporadas
+
+    df = pd.concat([parse_jogadores(p, liga, temporada)[0] for payloads in gerar_temporadas(args.escala)
+                    for (liga, temporada), p in payloads.items()], ignore_index=True)
+    relatorio = relatorio_memoria(df)
+    print(relatorio.to_string(float_format=lambda v: f"{v:,.1f}"))
+    total = relatorio.loc['TOTAL']
+    print(f"\n{len(df):,} linhas: {total['bytes_original'] / len(df):.0f} -> "
+          f"{total['bytes_compacto'] / len(df):.0f} bytes por jogador-temporada")
+
+
+if __name__ == "__main__":
+    main()
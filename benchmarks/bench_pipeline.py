@@ -0,0 +1,155 @@
+"""Benchmark offline das etapas do pipeline sobre dados sintéticos no formato do Understat.
+
+    python benchmarks/bench_pipeline.py                      # escalas 1, 10 e 100
+    python benchmarks/bench_pipeline.py --escalas 1 10 100 1000
+    python benchmarks/bench_pipeline.py --salvar-baseline    # atualiza benchmarks/baseline.json
+
+Escala 1 ≈ 2.8k jogadores (uma temporada das 5 ligas); escala N gera N temporadas.
+Os tempos são comparados com a baseline gravada e regressões acima da tolerância são marcadas.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from analise_atacantes.consolidacao import consolidar_transferencias
+from analise_atacantes.filtros import aplicar_filtros_realistas, clubes_grandes
+from analise_atacantes.incerteza import bootstrap_score
+from analise_atacantes.metricas import parse_jogadores
+from analise_atacantes.perfil import RelatorioExecucao, medir
+from analise_atacantes.score import MotorScore, pontuar_atacantes
+from analise_atacantes.selecao import criar_shortlist_final
+from analise_atacantes.sintetico import gerar_temporadas
+from analise_atacantes.tipos import compactar
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(DIRETORIO, 'baseline.json')
+
+
+def parse_temporadas(relatorio, escala: int, semente: int):
+    """Gera e faz o parse de uma temporada por vez, para a escala 1000 caber em memória.
+
+    O tempo da etapa 'parse' soma só o parse de cada temporada e a concatenação final
+    (a geração dos payloads fica de fora); o pico de memória é o do laço inteiro.
+    """
+    partes = []
+    with medir('parse', 'total') as total:
+        for payloads in gerar_temporadas(escala, semente):
+            with medir('parse', 'temporada', linhas=sum(len(p) for p in payloads.values())):
+                partes.extend(parse_jogadores(p, liga, temporada)[0] for (liga, temporada), p in payloads.items())
+        with medir('parse', 'concatenar', linhas=0):
+            df = compactar(pd.concat(partes, ignore_index=True))
+        del partes
+
+    medicoes = [m for m in relatorio.medicoes if m['categoria'] == 'parse' and m['nome'] != 'total']
+    relatorio.medicoes = [m for m in relatorio.medicoes if m['categoria'] != 'parse']
+    etapa = {'linhas': sum(m['linhas'] for m in medicoes),
+             'parede_s': sum(m['parede_s'] for m in medicoes),
+             'cpu_s': sum(m['cpu_s'] for m in medicoes)}
+    if 'pico_memoria_mb' in total:
+        etapa['pico_memoria_mb'] = total['pico_memoria_mb']
+    relatorio.registrar('etapa', 'parse', **etapa)
+    return df
+
+
+def executar_etapas(escala: int, semente: int, graficos: bool, memoria: bool):
+    relatorio = RelatorioExecucao(memoria=memoria)
+
+    with relatorio.ativo():
+        df = parse_temporadas(relatorio, escala, semente)
+        with medir('etapa', 'consolidar', linhas=len(df)):
+            df = compactar(consolidar_transferencias(df))
+        with medir('etapa', 'filtrar', linhas=len(df)):
+            df_fwd = aplicar_filtros_realistas(df, clubes_grandes)
+        with medir('etapa', 'pontuar', linhas=len(df_fwd)):
+            df_fwd = pontuar_atacantes(df_fwd)
+        with medir('etapa', 'selecionar', linhas=len(df_fwd)):
+            shortlist = criar_shortlist_final(df_fwd)
+        with medir('etapa', 'perfis_1000', linhas=len(df_fwd) * 1000):
+            pesos = np.random.default_rng(semente).dirichlet(np.ones(4), 1000)
+            MotorScore(df_fwd).rankings(pesos)
+        with medir('etapa', 'bootstrap_1000', linhas=len(df_fwd) * 1000):
+            bootstrap_score(df_fwd, 1000, semente=semente)
+        if graficos:
+            from analise_atacantes.graficos import renderizar_dashboards
+
+            with tempfile.TemporaryDirectory() as diretorio, medir('etapa', 'renderizar', linhas=len(shortlist)):
+                renderizar_dashboards(shortlist, df_fwd, diretorio, 'png', dpi=100, processos=1,
+                                      usar_cache=False)
+    return {m['nome']: m for m in relatorio.medicoes if m['categoria'] == 'etapa'}
+
+
+def rodar_escala(escala: int, semente: int, graficos: bool):
+    """Tempos numa passada sem tracemalloc (que distorce bastante o pandas) e memória noutra."""
+    tempos = executar_etapas(escala, semente, graficos, memoria=False)
+    memoria = executar_etapas(escala, semente, False, memoria=True)
+
+    resultados = {}
+    for nome, m in tempos.items():
+        resultados[nome] = {
+            'linhas': m['linhas'],
+            'parede_s': m['parede_s'],
+            'linhas_por_s': m['linhas'] / m['parede_s'] if m['parede_s'] > 0 else None,
+            'pico_memoria_mb': memoria[nome]['pico_memoria_mb'] if nome in memoria else None,
+        }
+    return resultados
+
+
+def comparar(resultados, baseline, tolerancia: float):
+    regressoes = []
+    print(f"{'escala':>6} {'etapa':<14} {'linhas':>10} {'tempo(s)':>9} {'linhas/s':>12} "
+          f"{'mem(MB)':>8} {'vs base':>8}")
+    for escala, etapas in resultados.items():
+        for etapa, r in etapas.items():
+            base = baseline.get(escala, {}).get(etapa)
+            razao = r['parede_s'] / base['parede_s'] if base and base['parede_s'] > 0 else None
+            marca = ''
+            if razao is not None and razao > tolerancia:
+                marca = ' REGRESSÃO'
+                regressoes.append((escala, etapa, razao))
+            vs = f"{razao:.2f}x" if razao is not None else '-'
+            print(f"{escala:>6} {etapa:<14} {r['linhas']:>10,} {r['parede_s']:>9.3f} "
+                  f"{(r['linhas_por_s'] or 0):>12,.0f} {(r['pico_memoria_mb'] or 0):>8.1f} {vs:>8}{marca}")
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--escalas", nargs="+", type=int, default=[1, 10, 100])
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--graficos", action="store_true", help="inclui a renderização dos dashboards")
+    parser.add_argument("--tolerancia", type=float, default=1.25,
+                        help="razão tempo/baseline acima da qual a etapa é marcada como regressão")
+    parser.add_argument("--saida", default=None, help="grava os resultados em JSON")
+    parser.add_argument("--salvar-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    resultados = {str(escala): rodar_escala(escala, args.semente, args.graficos) for escala in args.escalas}
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE, encoding="utf-8") as f:
+            baseline = json.load(f)['resultados']
+    regressoes = comparar(resultados, baseline, args.tolerancia)
+
+    documento = {'python': platform.python_version(), 'pandas': pd.__version__, 'numpy': np.__version__,
+                 'semente': args.semente, 'resultados': resultados}
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(documento, f, indent=2)
+    if args.salvar_baseline:
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(documento, f, indent=2)
+        print(f"Baseline gravada em {BASELINE}")
+    return 1 if regressoes and not args.salvar_baseline else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
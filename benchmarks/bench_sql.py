@@ -0,0 +1,82 @@
+"""Throughput da camada SQL (armazenamento.py) sobre um SQLite local com dados sintéticos.
+
+    python benchmarks/bench_sql.py                    # 10 e 50 temporadas (~29k e ~144k linhas)
+    python benchmarks/bench_sql.py --escalas 100 --db "sqlite:////tmp/atacantes.db"
+
+Mede a gravação em bloco (comparada ao INSERT multi-linha), o upsert de uma temporada
+sobre a tabela cheia, a consulta de partições e a leitura em streaming (comparada à
+leitura de uma vez só), com tempo numa passada e pico de memória das leituras em outra.
+Sem `--chunksize`, cada bloco da leitura em streaming tem 1/FRACAO_BLOCO da tabela, para
+o pico de memória dela ficar abaixo do da leitura inteira em qualquer escala.
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from analise_atacantes.armazenamento import criar_engine, gravar_particoes, ler_particoes, particoes_existentes
+from analise_atacantes.metricas import parse_jogadores
+from analise_atacantes.perfil import RelatorioExecucao, medir
+from analise_atacantes.sintetico import gerar_temporadas
+
+FRACAO_BLOCO = 20
+
+
+def executar_etapas(df, url: str, memoria: bool, chunksize: int):
+    engine = criar_engine(url)
+    pares = list(df.groupby(['Liga', 'Temporada']).groups)
+    ultima = df[df['Temporada'] == df['Temporada'].max()]
+    relatorio = RelatorioExecucao(memoria=memoria)
+
+    with relatorio.ativo():
+        # Gravações só na passada de tempo; a de memória reaproveita as tabelas e mede as leituras
+        if not memoria:
+            with engine.begin() as conn:
+                for tabela in ['bench_multi', 'bench']:
+                    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {tabela}")
+            with medir('etapa', 'inserir_multi', linhas=len(df)), engine.begin() as conn:
+                df.to_sql('bench_multi', con=conn, index=False, chunksize=2000 // len(df.columns), method='multi')
+            with medir('etapa', 'gravar', linhas=len(df)):
+                gravar_particoes(engine, df, 'bench')
+            with medir('etapa', 'upsert', linhas=len(ultima)):
+                gravar_particoes(engine, ultima, 'bench')
+        with medir('etapa', 'particoes', linhas=len(df)):
+            particoes_existentes(engine, 'bench')
+        with medir('etapa', 'ler_stream', linhas=len(df)):
+            lidas = sum(len(bloco) for bloco in ler_particoes(engine, pares, 'bench', chunksize))
+        assert lidas == len(df), (lidas, len(df))
+        with medir('etapa', 'ler_inteiro', linhas=len(df)):
+            pd.read_sql_query("SELECT * FROM bench", con=engine)
+    return {m['nome']: m for m in relatorio.medicoes if m['categoria'] == 'etapa'}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--escalas", nargs="+", type=int, default=[10, 50])
+    parser.add_argument("--db", default=None, help="string de conexão (padrão: SQLite temporário)")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help=f"linhas por bloco na leitura em streaming (padrão: tabela / {FRACAO_BLOCO})")
+    args = parser.parse_args(argv)
+
+    print(f"{'escala':>6} {'etapa':<14} {'linhas':>10} {'tempo(s)':>9} {'linhas/s':>12} {'mem(MB)':>8}")
+    with tempfile.TemporaryDirectory() as diretorio:
+        url = args.db or f"sqlite:///{os.path.join(diretorio, 'bench.db')}"
+        for escala in args.escalas:
+            df = pd.concat([parse_jogadores(p, liga, temporada)[0] for payloads in gerar_temporadas(escala)
+                            for (liga, temporada), p in payloads.items()], ignore_index=True)
+            chunksize = args.chunksize or max(1000, len(df) // FRACAO_BLOCO)
+            tempos = executar_etapas(df, url, memoria=False, chunksize=chunksize)
+            memoria = executar_etapas(df, url, memoria=True, chunksize=chunksize)
+            for nome, m in tempos.items():
+                pico = f"{memoria[nome]['pico_memoria_mb']:.1f}" if nome in memoria else '-'
+                print(f"{escala:>6} {nome:<14} {m['linhas']:>10,} {m['parede_s']:>9.3f} "
+                      f"{m['linhas'] / m['parede_s']:>12,.0f} {pico:>8}")
+            print(f"{escala:>6} (leitura em streaming em blocos de {chunksize:,} linhas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""ClienteUnderstat contra um servidor aiohttp local que imita o Understat (sem rede).
+
+    python -m pytest tests
+"""
+import asyncio
+import json
+import time
+from collections import Counter
+from email.utils import formatdate
+
+import aiohttp
+import numpy as np
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from analise_atacantes.cliente_understat import (BaldeTokens, CacheRespostas, ClienteUnderstat, NOMES_URL,
+                                                 segundos_retry_after, temporada_atual)
+from analise_atacantes.coleta import coletar_ligas, coletar_partidas_jogadores
+from analise_atacantes.perfil import RelatorioExecucao
+from analise_atacantes.sintetico import gerar_temporada
+
+LIGAS = ['epl', 'La_Liga']
+JOGADORES = [101, 102, 103]
+PARES = [(liga, temporada) for liga in LIGAS for temporada in (temporada_atual(), temporada_atual() - 1)]
+
+
+class ServidorFalso:
+    """Endpoints getLeagueData/getPlayerData com ETag fixo por recurso e contagem das requisições.
+
+    `falhas_429` lista caminhos cuja primeira requisição recebe 429 (Retry-After em data
+    HTTP); `sempre_304` lista caminhos que respondem 304 a qualquer requisição.
+    """
+
+    def __init__(self, semente: int = 42):
+        rng = np.random.default_rng(semente)
+        self.ligas = {}
+        for temporada in (temporada_atual(), temporada_atual() - 1):
+            for (liga, _), jogadores in gerar_temporada(rng, temporada, jogadores_por_liga=20).items():
+                self.ligas[(NOMES_URL.get(liga, liga), str(temporada))] = jogadores
+        self.requisicoes = Counter()
+        self.status = Counter()
+        self.falhas_429 = set()
+        self.sempre_304 = set()
+
+    def _responder(self, request, corpo):
+        caminho = request.path
+        self.requisicoes[caminho] += 1
+        if caminho in self.sempre_304:
+            resposta = web.Response(status=304)
+        elif caminho in self.falhas_429:
+            self.falhas_429.discard(caminho)
+            resposta = web.Response(status=429, headers={'Retry-After': formatdate(time.time() + 1, usegmt=True)})
+        else:
+            etag = f'"{hash(corpo) & 0xffffffff:x}"'
+            if request.headers.get('If-None-Match') == etag:
+                resposta = web.Response(status=304, headers={'ETag': etag})
+            else:
+                resposta = web.Response(text=corpo, content_type='application/json', headers={'ETag': etag})
+        self.status[resposta.status] += 1
+        return resposta
+
+    async def liga(self, request):
+        jogadores = self.ligas.get((request.match_info['liga'], request.match_info['temporada']))
+        if jogadores is None:
+            raise web.HTTPNotFound()
+        return self._responder(request, json.dumps({'players': jogadores}))
+
+    async def jogador(self, request):
+        id_jogador = int(request.match_info['id'])
+        partidas = [{'id': str(id_jogador * 100 + k), 'date': f"2024-08-{10 + k:02d} 20:00:00",
+                     'season': str(temporada_atual()), 'time': '90', 'goals': str(k % 2), 'xG': '0.4'}
+                    for k in range(6)]
+        return self._responder(request, json.dumps({'matches': partidas}))
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get('/getLeagueData/{liga}/{temporada}', self.liga)
+        app.router.add_get('/getPlayerData/{id}', self.jogador)
+        return app
+
+
+def rodar(teste):
+    """Executa `teste(servidor, url)` com o servidor falso no ar; retorna o servidor."""
+    servidor = ServidorFalso()
+
+    async def principal():
+        async with TestServer(servidor.app()) as ts:
+            await teste(servidor, f"http://{ts.host}:{ts.port}")
+
+    asyncio.run(principal())
+    return servidor
+
+
+async def coletar(servidor, url, diretorio, ttl_atual):
+    """Coleta ligas e partidas; retorna as origens das medições 'http' e as requisições feitas."""
+    def fabrica(session):
+        return ClienteUnderstat(session, CacheRespostas(str(diretorio)), BaldeTokens(50, 10), ttl_atual, url)
+
+    antes = sum(servidor.requisicoes.values())
+    relatorio = RelatorioExecucao(memoria=False)
+    with relatorio.ativo():
+        ligas = await coletar_ligas(PARES, backoff=0.05, client_factory=fabrica)
+        partidas = await coletar_partidas_jogadores(JOGADORES, backoff=0.05, client_factory=fabrica)
+    assert set(ligas) == set(PARES)
+    assert set(partidas) == set(JOGADORES)
+    origens = Counter(m['origem'] for m in relatorio.medicoes if m['categoria'] == 'http')
+    return origens, sum(servidor.requisicoes.values()) - antes
+
+
+def test_repeticao_com_cache_valido_nao_faz_requisicoes(tmp_path):
+    total = len(PARES) + len(JOGADORES)
+
+    async def teste(servidor, url):
+        origens, requisicoes = await coletar(servidor, url, tmp_path, ttl_atual=3600)
+        assert origens['rede'] == total
+        assert requisicoes == total
+
+        origens, requisicoes = await coletar(servidor, url, tmp_path, ttl_atual=3600)
+        assert requisicoes == 0
+        assert origens['cache'] == total
+
+    rodar(teste)
+
+
+def test_ttl_zero_revalida_so_temporada_atual_e_partidas_com_304(tmp_path):
+    atuais = len(LIGAS) + len(JOGADORES)
+
+    async def teste(servidor, url):
+        await coletar(servidor, url, tmp_path, ttl_atual=3600)
+        status_antes = servidor.status[304]
+        origens, requisicoes = await coletar(servidor, url, tmp_path, ttl_atual=0)
+        assert requisicoes == atuais
+        assert origens['revalidado'] == atuais
+        assert servidor.status[304] - status_antes == atuais
+        # Temporadas encerradas nunca expiram
+        assert origens['cache'] == len(PARES) - len(LIGAS)
+
+    rodar(teste)
+
+
+def test_429_com_retry_after_em_data_http_e_repetido(tmp_path):
+    caminho = f"/getLeagueData/{NOMES_URL['epl']}/{temporada_atual()}"
+
+    async def teste(servidor, url):
+        servidor.falhas_429.add(caminho)
+        await coletar(servidor, url, tmp_path, ttl_atual=3600)
+
+    servidor = rodar(teste)
+    assert servidor.status[429] == 1
+    assert servidor.requisicoes[caminho] == 2
+
+
+def test_304_sem_resposta_em_cache_vira_erro_http(tmp_path):
+    async def teste(servidor, url):
+        servidor.sempre_304.add('/getPlayerData/999')
+        async with aiohttp.ClientSession() as session:
+            cliente = ClienteUnderstat(session, CacheRespostas(str(tmp_path)), BaldeTokens(50, 10), url_base=url)
+            with pytest.raises(aiohttp.ClientResponseError) as erro:
+                await cliente.get_player_matches(999)
+        assert erro.value.status == 304
+
+    rodar(teste)
+
+
+def test_segundos_retry_after():
+    assert segundos_retry_after(None, 5.0) == 5.0
+    assert segundos_retry_after('12', 5.0) == 12.0
+    assert segundos_retry_after('invalido', 5.0) == 5.0
+    assert segundos_retry_after(formatdate(time.time() - 60, usegmt=True), 5.0) == 0.0
+    assert 25 < segundos_retry_after(formatdate(time.time() + 30, usegmt=True), 5.0) <= 30